@@ -32,3 +32,23 @@ class VoiceApiConfig(AppConfig):
             logger.error(f"✗ Failed to start appointment scheduler: {str(e)}")
             import traceback
             traceback.print_exc()
+
+        try:
+            # Build the shared service singletons now rather than on the
+            # first request - constructing them reads settings and sets up
+            # the pooled HTTP session, and doing it here also surfaces
+            # missing API keys in the startup log instead of mid-request.
+            # These are HTTP-backed services; there are no local model
+            # weights to warm, so no network call is made here.
+            from voice_api.services import (
+                get_speech_service, get_intent_service,
+                get_entity_service, get_chat_service, get_summary_service,
+            )
+
+            for factory in (get_speech_service, get_intent_service,
+                            get_entity_service, get_chat_service,
+                            get_summary_service):
+                factory()
+            logger.info("✓ Service singletons initialised")
+        except Exception as e:
+            logger.error(f"✗ Failed to initialise service singletons: {str(e)}")
@@ -7,10 +7,11 @@ Usage:
 """
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.utils import timezone
 from voice_api.services.calendar_service import CalendarService
 from voice_api.services.appointment_recording_service import AppointmentRecordingService
-from voice_api.models import CalendarAppointment
+from voice_api.models import AppointmentRecording, CalendarAppointment
 import logging
 
 logger = logging.getLogger(__name__)
@@ -97,15 +98,33 @@ class Command(BaseCommand):
     def stop_recordings(self):
         """Stop recordings for appointments that should have ended"""
         try:
-            appointments = CalendarService.get_appointments_to_stop_recording()
+            appointments = list(CalendarService.get_appointments_to_stop_recording())
             count = 0
 
-            for appointment in appointments:
-                try:
-                    # Get the recording
-                    recording = AppointmentRecordingService.get_recording_by_appointment(appointment.id)
+            if appointments:
+                now = timezone.now()
+
+                # Lock rows with skip_locked so a concurrent scheduler run skips
+                # rows this command already holds instead of queuing on the lock
+                with transaction.atomic():
+                    recordings = list(
+                        AppointmentRecording.objects
+                        .select_for_update(skip_locked=True)
+                        .filter(
+                            appointment__in=appointments,
+                            recording_status='recording'
+                        )
+                    )
+
+                    recording_by_appointment = {r.appointment_id: r for r in recordings}
+                    completed_appointments = []
+
+                    for appointment in appointments:
+                        recording = recording_by_appointment.get(appointment.id)
+
+                        if not recording:
+                            continue
 
-                    if recording and recording.recording_status == 'recording':
                         # In a real implementation, you would:
                         # 1. Stop the actual audio recording (hardware/software integration)
                         # 2. Save the audio file
@@ -113,12 +132,13 @@ class Command(BaseCommand):
 
                         # For now, we'll mark it as ready for manual upload
                         recording.recording_status = 'pending'
-                        recording.recording_ended_at = timezone.now()
-                        recording.save()
+                        recording.recording_ended_at = now
+                        recording.updated_at = now  # bulk_update skips auto_now
 
                         # Update appointment status
                         appointment.status = 'completed'
-                        appointment.save()
+                        appointment.updated_at = now
+                        completed_appointments.append(appointment)
 
                         count += 1
                         self.stdout.write(self.style.SUCCESS(
@@ -128,11 +148,15 @@ class Command(BaseCommand):
                             f'  → Recording marked as pending upload. User can manually upload the audio file.'
                         ))
 
-                except Exception as e:
-                    self.stdout.write(self.style.ERROR(
-                        f'✗ Error stopping recording for appointment {appointment.id}: {str(e)}'
-                    ))
-                    logger.error(f'Error stopping recording for appointment {appointment.id}: {str(e)}')
+                    # One UPDATE per table instead of two round-trips per appointment
+                    AppointmentRecording.objects.bulk_update(
+                        recordings,
+                        ['recording_status', 'recording_ended_at', 'updated_at']
+                    )
+                    CalendarAppointment.objects.bulk_update(
+                        completed_appointments,
+                        ['status', 'updated_at']
+                    )
 
             self.stdout.write(self.style.SUCCESS(f'Stopped {count} recordings'))
 
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-09-01 08:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('voice_api', '0012_calendarappointment_base_url'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='phoneverification',
+            index=models.Index(fields=['phone_number', 'is_verified', '-created_at'], name='pv_lookup_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.7 on 2026-09-01 08:30
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('voice_api', '0013_phoneverification_pv_lookup_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='voicerequest',
+            name='voice_reque_keyword_fa2b0f_idx',
+        ),
+        migrations.AddIndex(
+            model_name='voicerequest',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['keywords'], name='vr_keywords_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='voicerequest',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['topics'], name='vr_topics_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='voicerequest',
+            index=models.Index(fields=['status', 'intent', '-created_at'], name='vr_list_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-09-01 08:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('voice_api', '0014_remove_voicerequest_voice_reque_keyword_fa2b0f_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='contextquestion',
+            name='context_que_message_bcee30_idx',
+        ),
+        migrations.AddIndex(
+            model_name='contextquestion',
+            index=models.Index(fields=['message', '-created_at'], name='cq_msg_created_idx'),
+        ),
+    ]
@@ -5,6 +5,7 @@ File: voice_api/models.py
 
 from django.db import models
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 import uuid
 
 
@@ -87,7 +88,12 @@ class VoiceRequest(models.Model):
         indexes = [
             models.Index(fields=['status', 'created_at']),
             models.Index(fields=['intent']),
-            models.Index(fields=['keywords']),  # Index for searching by keywords
+            # GIN indexes serve the keywords/topics __contains filters in
+            # the list view; a btree on an ArrayField cannot
+            GinIndex(fields=['keywords'], name='vr_keywords_gin'),
+            GinIndex(fields=['topics'], name='vr_topics_gin'),
+            # Serves the filtered, newest-first list pagination
+            models.Index(fields=['status', 'intent', '-created_at'], name='vr_list_idx'),
         ]
     
     def __str__(self):
@@ -114,6 +120,8 @@ class PhoneVerification(models.Model):
         indexes = [
             models.Index(fields=['phone_number', 'is_verified']),
             models.Index(fields=['otp_code']),
+            # Serves VerifyOTPView's filter + order_by('-created_at').first()
+            models.Index(fields=['phone_number', 'is_verified', '-created_at'], name='pv_lookup_idx'),
         ]
 
     def __str__(self):
@@ -269,7 +277,9 @@ class ContextQuestion(models.Model):
         ordering = ['created_at']
         indexes = [
             models.Index(fields=['conversation', 'created_at']),
-            models.Index(fields=['message']),
+            # Serves the per-message question list and the repeat-answer
+            # lookup, both of which order newest-first within a message
+            models.Index(fields=['message', '-created_at'], name='cq_msg_created_idx'),
         ]
 
     def __str__(self):
@@ -0,0 +1,24 @@
+"""
+orjson-backed response rendering
+File: voice_api/renderers.py
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Drop-in replacement for DRF's JSONRenderer backed by orjson.
+
+    orjson serializes in native code, several times faster than stdlib
+    json on the chat payloads (long answer strings plus entity lists),
+    and handles datetimes and UUIDs without manual conversion. Anything
+    it doesn't know falls back to str(), matching how the views already
+    stringify ids.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=str)
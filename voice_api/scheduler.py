@@ -4,7 +4,9 @@ Runs every minute to check for pending appointments
 """
 
 from apscheduler.schedulers.background import BackgroundScheduler
+from django.db import transaction
 from django.utils import timezone
+from voice_api.models import AppointmentRecording, CalendarAppointment
 from voice_api.services.calendar_service import CalendarService
 from voice_api.services.appointment_recording_service import AppointmentRecordingService
 import logging
@@ -103,38 +105,65 @@ def start_recordings():
 def stop_recordings():
     """Stop recordings for appointments that should have ended and process them"""
     try:
-        appointments = CalendarService.get_appointments_to_stop_recording()
-        count = 0
+        appointments = list(CalendarService.get_appointments_to_stop_recording())
 
-        for appointment in appointments:
-            try:
-                # Get the recording
-                recording = AppointmentRecordingService.get_recording_by_appointment(appointment.id)
+        if not appointments:
+            return
 
-                if recording and recording.recording_status == 'recording':
-                    # Mark recording as ready for processing
-                    recording.recording_status = 'processing'
-                    recording.recording_ended_at = timezone.now()
+        now = timezone.now()
 
-                    # Calculate duration
-                    duration = recording.recording_ended_at - recording.recording_started_at
-                    recording.duration_seconds = int(duration.total_seconds())
-                    recording.save()
+        # Lock the rows we are about to mutate. skip_locked makes a competing
+        # worker (e.g. the management command running alongside the scheduler)
+        # skip rows this process already holds instead of queuing on the lock.
+        with transaction.atomic():
+            recordings = list(
+                AppointmentRecording.objects
+                .select_for_update(skip_locked=True)
+                .filter(
+                    appointment__in=appointments,
+                    recording_status='recording'
+                )
+            )
 
-                    # Update appointment status
-                    appointment.status = 'completed'
-                    appointment.save()
+            recording_by_appointment = {r.appointment_id: r for r in recordings}
+            completed_appointments = []
 
-                    count += 1
-                    logger.info(f"⏹️ Stopped recording for: {appointment.title} (ID: {appointment.id})")
-                    logger.info(f"   → Duration: {recording.duration_seconds}s")
-                    logger.info(f"   → Status: Processing (waiting for audio upload)")
+            for appointment in appointments:
+                recording = recording_by_appointment.get(appointment.id)
 
-            except Exception as e:
-                logger.error(f"✗ Error stopping recording for appointment {appointment.id}: {str(e)}")
+                if not recording:
+                    continue
 
-        if count > 0:
-            logger.info(f"🛑 Stopped {count} recording(s)")
+                # Mark recording as ready for processing
+                recording.recording_status = 'processing'
+                recording.recording_ended_at = now
+
+                # Calculate duration
+                duration = recording.recording_ended_at - recording.recording_started_at
+                recording.duration_seconds = int(duration.total_seconds())
+                recording.updated_at = now  # bulk_update skips auto_now
+
+                # Update appointment status
+                appointment.status = 'completed'
+                appointment.updated_at = now
+                completed_appointments.append(appointment)
+
+                logger.info(f"⏹️ Stopped recording for: {appointment.title} (ID: {appointment.id})")
+                logger.info(f"   → Duration: {recording.duration_seconds}s")
+                logger.info(f"   → Status: Processing (waiting for audio upload)")
+
+            # One UPDATE per table instead of two round-trips per appointment
+            AppointmentRecording.objects.bulk_update(
+                recordings,
+                ['recording_status', 'recording_ended_at', 'duration_seconds', 'updated_at']
+            )
+            CalendarAppointment.objects.bulk_update(
+                completed_appointments,
+                ['status', 'updated_at']
+            )
+
+        if recordings:
+            logger.info(f"🛑 Stopped {len(recordings)} recording(s)")
 
     except Exception as e:
         logger.error(f"✗ Error in stop_recordings: {str(e)}")
@@ -29,6 +29,18 @@ class VoiceRequestSerializer(serializers.ModelSerializer):
         ]
 
 
+class VoiceRequestListSerializer(serializers.ModelSerializer):
+    """Slim serializer for list views - omits transcript and entity blobs"""
+
+    class Meta:
+        model = VoiceRequest
+        fields = [
+            'id', 'file_size', 'file_format', 'intent', 'intent_confidence',
+            'status', 'created_at', 'processed_at'
+        ]
+        read_only_fields = fields
+
+
 class VoiceUploadSerializer(serializers.Serializer):
     """Serializer for voice file upload"""
     
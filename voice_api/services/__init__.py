@@ -0,0 +1,46 @@
+"""
+Shared service instances
+File: voice_api/services/__init__.py
+
+The speech/intent/entity/chat services are stateless wrappers around
+HTTP APIs, so a single instance can serve every request and task instead
+of being rebuilt per call.
+"""
+
+from functools import lru_cache
+
+from .speech_to_text_service import SpeechToTextService
+from .intent_classifier_service import IntentClassifierService
+from .entity_extraction_service import EntityExtractionService
+from .chat_service import ChatService
+from .summary_service import SummaryService
+
+
+@lru_cache(maxsize=1)
+def get_speech_service():
+    """Shared SpeechToTextService instance"""
+    return SpeechToTextService()
+
+
+@lru_cache(maxsize=1)
+def get_intent_service():
+    """Shared IntentClassifierService instance"""
+    return IntentClassifierService()
+
+
+@lru_cache(maxsize=1)
+def get_entity_service():
+    """Shared EntityExtractionService instance"""
+    return EntityExtractionService()
+
+
+@lru_cache(maxsize=1)
+def get_chat_service():
+    """Shared ChatService instance"""
+    return ChatService()
+
+
+@lru_cache(maxsize=1)
+def get_summary_service():
+    """Shared SummaryService instance"""
+    return SummaryService()
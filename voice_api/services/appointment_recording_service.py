@@ -5,9 +5,7 @@ File: voice_api/services/appointment_recording_service.py
 
 from django.utils import timezone
 from voice_api.models import CalendarAppointment, AppointmentRecording
-from voice_api.services.speech_to_text_service import SpeechToTextService
-from voice_api.services.intent_classifier_service import IntentClassifierService
-from voice_api.services.entity_extraction_service import EntityExtractionService
+from voice_api.services import get_speech_service, get_intent_service, get_entity_service
 import logging
 import os
 
@@ -118,7 +116,7 @@ class AppointmentRecordingService:
 
             # Step 1: Transcribe audio
             logger.info(f"Transcribing recording: {recording_id}")
-            speech_service = SpeechToTextService()
+            speech_service = get_speech_service()
             transcription_result = speech_service.transcribe_audio(recording.audio_file)
 
             if transcription_result['status'] == 'success':
@@ -131,7 +129,7 @@ class AppointmentRecordingService:
 
             # Step 2: Classify intent
             logger.info(f"Classifying intent for recording: {recording_id}")
-            intent_service = IntentClassifierService()
+            intent_service = get_intent_service()
             intent_result = intent_service.classify_intent(recording.transcribed_text)
 
             if intent_result['status'] == 'success':
@@ -144,7 +142,7 @@ class AppointmentRecordingService:
 
             # Step 3: Extract entities
             logger.info(f"Extracting entities for recording: {recording_id}")
-            entity_service = EntityExtractionService()
+            entity_service = get_entity_service()
             entity_result = entity_service.extract_entities(recording.transcribed_text)
 
             if entity_result['status'] == 'success':
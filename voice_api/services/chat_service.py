@@ -5,6 +5,7 @@ File: voice_api/services/chat_service.py
 
 import requests
 import logging
+import threading
 from django.conf import settings
 
 logger = logging.getLogger('voice_api')
@@ -15,6 +16,12 @@ class ChatService:
 
     GROQ_API_URL = "https://api.groq.com/openai/v1/chat/completions"
 
+    # Cap simultaneous Groq completions per process: under a burst every
+    # worker thread would otherwise fire at once and trip the upstream
+    # rate limit, turning slowness into hard failures
+    MAX_CONCURRENT_REQUESTS = 32
+    _request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
     @staticmethod
     def generate_response(conversation_history, current_message):
         """
@@ -27,6 +34,12 @@ class ChatService:
 
         Returns:
             tuple: (response_text: str, error_message: str or None)
+
+        Note: this intentionally returns the complete response rather than
+        streaming tokens. Token streaming (SSE) needs an ASGI deployment
+        and a frontend that renders partial answers; the API contract also
+        persists the full answer as a ContextQuestion before responding.
+        Revisit if the stack moves to ASGI.
         """
         try:
             api_key = settings.GROQ_API_KEY
@@ -73,12 +86,13 @@ class ChatService:
             }
 
             # Make request to Groq
-            response = requests.post(
-                ChatService.GROQ_API_URL,
-                json=payload,
-                headers=headers,
-                timeout=30
-            )
+            with ChatService._request_slots:
+                response = requests.post(
+                    ChatService.GROQ_API_URL,
+                    json=payload,
+                    headers=headers,
+                    timeout=30
+                )
 
             if response.status_code == 200:
                 data = response.json()
@@ -8,14 +8,18 @@ from typing import List, Dict, Optional, Tuple
 import json
 import os
 
+from . import nlp_cache
+
 
 class EntityExtractionService:
     """Service for extracting key terms, entities, and important concepts from text"""
-    
+
+    MODEL = "llama-3.1-8b-instant"
+
     def __init__(self):
         self.api_key = os.environ.get('GROQ_API_KEY', '')
         self.api_url = "https://api.groq.com/openai/v1/chat/completions"
-    
+
     def extract_entities(self, text: str) -> Tuple[Dict, Optional[str]]:
         """
         Extract key entities, terms, and concepts from transcribed text
@@ -32,6 +36,17 @@ class EntityExtractionService:
             - topics: Main subjects/themes discussed
         """
         
+        if not text or not text.strip():
+            # Silent audio / failed ASR - nothing to extract, skip the
+            # LLM round-trip
+            return {
+                'keywords': [],
+                'entities': [],
+                'domain_terms': [],
+                'action_items': [],
+                'topics': []
+            }, None
+
         if not self.api_key:
             return {
                 'keywords': [],
@@ -40,7 +55,13 @@ class EntityExtractionService:
                 'action_items': [],
                 'topics': []
             }, "API key not configured"
-        
+
+        # Identical transcripts skip the LLM round-trip entirely
+        cache_key = nlp_cache.text_key('entities', self.MODEL, text)
+        cached = nlp_cache.get(cache_key)
+        if cached is not None:
+            return cached, None
+
         prompt = f"""Analyze this transcription and extract key information.
 
 Transcription: "{text}"
@@ -68,7 +89,7 @@ Respond ONLY with valid JSON:
             }
             
             data = {
-                "model": "llama-3.1-8b-instant",
+                "model": self.MODEL,
                 "messages": [
                     {
                         "role": "user",
@@ -108,7 +129,9 @@ Respond ONLY with valid JSON:
                 'action_items': result.get('action_items', []),
                 'topics': result.get('topics', [])
             }
-            
+
+            nlp_cache.set(cache_key, entities)
+
             return entities, None
             
         except Exception as e:
@@ -10,25 +10,41 @@ from typing import Tuple, Optional
 import json
 import os
 
+from . import nlp_cache
+
 
 class IntentClassifierService:
     """Service for classifying intent using Groq API (Free & Fast)"""
-    
+
+    MODEL = "llama-3.1-8b-instant"
+
     def __init__(self):
         self.api_key = os.environ.get('GROQ_API_KEY', '')
         self.api_url = "https://api.groq.com/openai/v1/chat/completions"
-    
+
     def classify_intent(self, text: str) -> Tuple[str, float, str, Optional[str]]:
         """
         Classify intent using Groq API
-        
+
         Returns:
             Tuple of (intent, confidence, summary, error_message)
         """
-        
+
+        if not text or not text.strip():
+            # Silent audio / failed ASR - nothing to classify, skip the
+            # LLM round-trip
+            return 'unknown_intent', 0.0, '', None
+
         if not self.api_key:
             return 'unknown_intent', 0.0, text[:100], "Groq API key not configured"
-        
+
+        # Identical transcripts skip the LLM round-trip entirely
+        cache_key = nlp_cache.text_key('intent', self.MODEL, text)
+        cached = nlp_cache.get(cache_key)
+        if cached is not None:
+            intent, confidence, summary = cached
+            return intent, confidence, summary, None
+
         prompt = f"""Analyze this voice message and classify the intent.
 
 Transcription: "{text}"
@@ -52,7 +68,7 @@ Respond ONLY with JSON:
             }
             
             data = {
-                "model": "llama-3.1-8b-instant",
+                "model": self.MODEL,
                 "messages": [
                     {
                         "role": "user",
@@ -87,7 +103,9 @@ Respond ONLY with JSON:
             intent = result.get('intent', 'unknown_intent')
             confidence = float(result.get('confidence', 0.5))
             summary = result.get('summary', text[:100])
-            
+
+            nlp_cache.set(cache_key, (intent, confidence, summary))
+
             return intent, confidence, summary, None
             
         except requests.exceptions.Timeout:
@@ -0,0 +1,49 @@
+"""
+Content-hash cache for NLP service results
+File: voice_api/services/nlp_cache.py
+
+Identical transcripts ("yes", "hello", ...) were re-sent to the LLM on
+every request, and re-uploads of the same clip were re-transcribed.
+Results are cached keyed by SHA-256 of the input (text or audio bytes),
+partitioned by model name so a model upgrade invalidates cleanly.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+
+# Bump when the prompt/response contract of a service changes so stale
+# entries from the old scheme are never served
+CACHE_VERSION = 'v1'
+
+
+def text_key(namespace, model, text):
+    """Build a cache key for a text-derived result (intent, entities)"""
+    digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+    return f"nlp:{CACHE_VERSION}:{namespace}:{model}:{digest}"
+
+
+def bytes_key(namespace, data):
+    """Build a cache key from an in-memory payload (e.g. upload buffers)"""
+    digest = hashlib.sha256(data).hexdigest()
+    return f"nlp:{CACHE_VERSION}:{namespace}:{digest}"
+
+
+def file_key(namespace, file_path):
+    """Build a cache key from file contents (e.g. re-uploaded audio clips)"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return f"nlp:{CACHE_VERSION}:{namespace}:{digest.hexdigest()}"
+
+
+def get(key):
+    """Fetch a cached result, or None on a miss"""
+    return cache.get(key)
+
+
+def set(key, value, ttl=None):
+    """Store a result with the configured NLP cache TTL"""
+    cache.set(key, value, ttl if ttl is not None else settings.NLP_CACHE_TTL)
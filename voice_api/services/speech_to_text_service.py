@@ -15,6 +15,8 @@ from typing import Optional, Tuple
 from django.conf import settings
 import logging
 
+from . import nlp_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,7 +33,12 @@ class SpeechToTextService:
             "authorization": self.api_key,
             "content-type": "application/json"
         }
-    
+        # One pooled session for the service's lifetime (it is shared via
+        # get_speech_service), so upload/request/poll reuse warm TLS
+        # connections instead of handshaking per call
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+
     def transcribe_audio(self, file_path: str) -> Tuple[Optional[str], Optional[str]]:
         """
         Transcribe audio file using AssemblyAI with optimal settings
@@ -45,8 +52,15 @@ class SpeechToTextService:
         
         if not self.api_key:
             return None, "AssemblyAI API key not configured"
-        
+
         try:
+            # Re-uploads of an identical clip skip upload + transcription
+            cache_key = nlp_cache.file_key('transcript', file_path)
+            cached = nlp_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Transcription cache hit, skipping AssemblyAI")
+                return cached, None
+
             # Step 1: Upload audio file
             logger.info(f"Uploading audio file: {file_path}")
             upload_url = self._upload_file(file_path)
@@ -64,21 +78,76 @@ class SpeechToTextService:
             # Step 3: Poll for results
             logger.info(f"Polling for transcription results: {transcript_id}")
             transcribed_text, error = self._poll_transcription(transcript_id)
-            
+
             if error:
                 return None, error
-            
+
+            nlp_cache.set(cache_key, transcribed_text)
+
             return transcribed_text, None
             
         except Exception as e:
             logger.error(f"Transcription error: {str(e)}")
             return None, f"Transcription failed: {str(e)}"
-    
+
+    def transcribe_audio_bytes(self, data: bytes) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Transcribe an audio payload that is already in memory.
+
+        Used by the chat upload views: the request body is read once, the
+        same buffer is written to disk for storage and handed here, so the
+        file on disk is never re-read just to upload it.
+
+        Args:
+            data: Raw audio bytes (any format AssemblyAI accepts)
+
+        Returns:
+            Tuple of (transcribed_text, error_message)
+        """
+
+        if not self.api_key:
+            return None, "AssemblyAI API key not configured"
+
+        try:
+            cache_key = nlp_cache.bytes_key('transcript', data)
+            cached = nlp_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Transcription cache hit, skipping AssemblyAI")
+                return cached, None
+
+            upload_url = self._upload_bytes(data)
+            if not upload_url:
+                return None, "Failed to upload audio file"
+
+            transcript_id = self._request_transcription(upload_url)
+            if not transcript_id:
+                return None, "Failed to start transcription"
+
+            transcribed_text, error = self._poll_transcription(transcript_id)
+            if error:
+                return None, error
+
+            nlp_cache.set(cache_key, transcribed_text)
+
+            return transcribed_text, None
+
+        except Exception as e:
+            logger.error(f"Transcription error: {str(e)}")
+            return None, f"Transcription failed: {str(e)}"
+
     def _upload_file(self, file_path: str, max_retries: int = 3) -> Optional[str]:
-        """Upload audio file to AssemblyAI with retry logic and chunked transfer"""
+        """Upload audio file to AssemblyAI"""
         file_size = os.path.getsize(file_path) / (1024 * 1024)  # MB
         logger.info(f"File size: {file_size:.2f} MB")
 
+        # Uploads are capped at MAX_UPLOAD_SIZE (10 MB), so reading the whole
+        # file is fine and lets retries re-send without reopening/seeking
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        return self._upload_bytes(data, max_retries=max_retries)
+
+    def _upload_bytes(self, data: bytes, max_retries: int = 3) -> Optional[str]:
+        """Upload an in-memory audio payload to AssemblyAI with retry logic"""
         # Use much longer timeout for slow connections
         timeout = (300, 300)  # (connect_timeout, read_timeout) in seconds
         logger.info(f"Using generous timeout for slow connections: {timeout}s")
@@ -87,21 +156,12 @@ class SpeechToTextService:
             try:
                 logger.info(f"Upload attempt {attempt + 1}/{max_retries}")
 
-                # Use streaming upload with chunked encoding
-                with open(file_path, 'rb') as f:
-                    # Create a session for connection reuse
-                    session = requests.Session()
-                    session.headers.update(self.headers)
-
-                    # Use streaming to handle slow uploads better
-                    response = session.post(
-                        f"{self.base_url}/v2/upload",
-                        data=f,
-                        timeout=timeout,
-                        stream=False  # Don't stream response, just upload
-                    )
-
-                    session.close()
+                response = self.session.post(
+                    f"{self.base_url}/v2/upload",
+                    data=data,
+                    timeout=timeout,
+                    stream=False  # Don't stream response, just upload
+                )
 
                 if response.status_code == 200:
                     upload_url = response.json().get('upload_url')
@@ -187,10 +247,9 @@ class SpeechToTextService:
                 "speech_threshold": 0.0,  # 0.0 = accept all, 0.5 = reject if <50% speech
             }
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/v2/transcript",
                 json=data,
-                headers=self.headers,
                 timeout=30
             )
             
@@ -216,12 +275,16 @@ class SpeechToTextService:
         """
         polling_url = f"{self.base_url}/v2/transcript/{transcript_id}"
         attempts = 0
-        
+
+        # Short voice-chat clips usually finish within a second or two, so
+        # start polling quickly and back off towards the old 3s interval
+        # for longer recordings
+        poll_delay = 0.5
+
         while attempts < max_attempts:
             try:
-                response = requests.get(
+                response = self.session.get(
                     polling_url,
-                    headers=self.headers,
                     timeout=30
                 )
                 
@@ -251,7 +314,8 @@ class SpeechToTextService:
                 else:
                     # Status is 'queued' or 'processing'
                     logger.info(f"Transcription status: {status} (attempt {attempts + 1}/{max_attempts})")
-                    time.sleep(3)  # Wait 3 seconds before next poll
+                    time.sleep(poll_delay)
+                    poll_delay = min(poll_delay * 2, 3.0)
                     attempts += 1
                     
             except Exception as e:
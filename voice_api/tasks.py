@@ -0,0 +1,115 @@
+"""
+Celery tasks for the voice processing pipeline
+File: voice_api/tasks.py
+
+The upload view only persists the audio file and queues this chain;
+transcription, intent classification, and entity extraction all run in
+Celery workers so HTTP workers are never blocked on the pipeline.
+"""
+
+from celery import chain, shared_task
+from concurrent.futures import ThreadPoolExecutor
+from django.utils import timezone
+import logging
+
+from .models import VoiceRequest
+from .services import get_speech_service, get_intent_service, get_entity_service
+
+logger = logging.getLogger(__name__)
+
+
+def process_voice_request(voice_request_id):
+    """
+    Queue the transcribe -> analyze chain for a voice request. Each step
+    persists its own results, so the pipeline is restartable from any
+    stage.
+    """
+    return chain(
+        transcribe_voice_request.s(str(voice_request_id)),
+        analyze_voice_request.s(),
+    ).delay()
+
+
+@shared_task
+def transcribe_voice_request(voice_request_id):
+    """Step 1: Transcribe audio to text"""
+    voice_request = VoiceRequest.objects.get(id=voice_request_id)
+
+    speech_service = get_speech_service()
+    transcribed_text, error = speech_service.transcribe_audio(voice_request.audio_file)
+
+    if error:
+        voice_request.status = 'failed'
+        voice_request.error_message = error
+        voice_request.save(update_fields=['status', 'error_message', 'updated_at'])
+        return None  # downstream tasks no-op
+
+    voice_request.transcribed_text = transcribed_text
+    if not transcribed_text or len(transcribed_text.strip()) < 3:
+        # Silence / failed ASR - skip the intent and entity LLM calls,
+        # there is nothing meaningful to classify
+        logger.info("Empty transcript for %s, skipping NLP steps", voice_request_id)
+        voice_request.status = 'completed'
+        voice_request.processed_at = timezone.now()
+        voice_request.save(update_fields=[
+            'transcribed_text', 'status', 'processed_at', 'updated_at'
+        ])
+        return None
+
+    voice_request.save(update_fields=['transcribed_text', 'updated_at'])
+    return voice_request_id
+
+
+@shared_task
+def analyze_voice_request(voice_request_id):
+    """
+    Step 2: Classify intent and extract entities, then mark completed.
+
+    The two LLM calls only need the transcript and are independent, so
+    they run concurrently in a small thread pool - task latency is
+    max(intent, entities) instead of their sum - and their results are
+    persisted in a single UPDATE.
+    """
+    if voice_request_id is None:
+        return None
+
+    voice_request = VoiceRequest.objects.get(id=voice_request_id)
+
+    intent_service = get_intent_service()
+    entity_service = get_entity_service()
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        intent_future = executor.submit(
+            intent_service.classify_intent, voice_request.transcribed_text
+        )
+        entities_future = executor.submit(
+            entity_service.extract_entities, voice_request.transcribed_text
+        )
+
+        intent, confidence, summary, intent_error = intent_future.result()
+        entities, entity_error = entities_future.result()
+
+    if intent_error:
+        logger.warning(f"Intent classification warning: {intent_error}")
+
+    voice_request.intent = intent
+    voice_request.intent_confidence = confidence
+    voice_request.intent_summary = summary
+
+    if entity_error:
+        logger.warning(f"Entity extraction warning: {entity_error}")
+    else:
+        voice_request.keywords = entities.get('keywords', [])
+        voice_request.entities = entities.get('entities', [])
+        voice_request.domain_terms = entities.get('domain_terms', [])
+        voice_request.action_items = entities.get('action_items', [])
+        voice_request.topics = entities.get('topics', [])
+
+    voice_request.status = 'completed'
+    voice_request.processed_at = timezone.now()
+    voice_request.save(update_fields=[
+        'intent', 'intent_confidence', 'intent_summary',
+        'keywords', 'entities', 'domain_terms', 'action_items', 'topics',
+        'status', 'processed_at', 'updated_at'
+    ])
+    return voice_request_id
@@ -8,120 +8,285 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser
 from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import F, Max, Q
 from django.utils import timezone
+from django.utils.crypto import constant_time_compare
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import base64
+import binascii
 import os
+import shutil
 import logging
+import uuid
 
 from .models import VoiceRequest, PhoneVerification, ChatConversation, ChatMessage, ContextQuestion
 from .serializers import (
-    VoiceRequestSerializer, VoiceUploadSerializer,
+    VoiceRequestSerializer, VoiceRequestListSerializer, VoiceUploadSerializer,
     SendOTPSerializer, VerifyOTPSerializer, PhoneVerificationSerializer,
     ChatMessageSerializer, ChatConversationSerializer, SendChatMessageSerializer
 )
-from .services.speech_to_text_service import SpeechToTextService
-from .services.intent_classifier_service import IntentClassifierService
-from .services.entity_extraction_service import EntityExtractionService
+from .services import (
+    get_speech_service, get_intent_service, get_entity_service,
+    get_chat_service, get_summary_service
+)
 from .services.otp_service import OTPService
-from .services.chat_service import ChatService
-from .services.summary_service import SummaryService
+from .tasks import process_voice_request
 
 logger = logging.getLogger(__name__)
 
+# Write uploads in 1 MiB chunks instead of the 4KB default - far fewer
+# Python-level iterations and write() syscalls per file
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Audio extensions accepted for uploads (mirrors the upload serializers)
+ALLOWED_AUDIO_EXTENSIONS = frozenset(['wav', 'mp3', 'ogg', 'webm', 'm4a', 'flac'])
+
+# Attachment classification and display tables - dict lookups instead of
+# the if/elif chains previously repeated across handlers
+ATTACHMENT_TYPE_BY_EXTENSION = {
+    'pdf': 'pdf',
+    **{ext: 'image' for ext in ('jpg', 'jpeg', 'png', 'gif', 'bmp', 'svg', 'webp')},
+    **{ext: 'document' for ext in ('doc', 'docx', 'txt', 'xls', 'xlsx', 'ppt', 'pptx')},
+}
+
+FILE_ICON_BY_TYPE = {'pdf': '📄', 'image': '🖼️', 'document': '📝'}
+DEFAULT_FILE_ICON = '📎'
+
+# Attachment types a client may declare directly (mirrors ChatMessage's
+# attachment_type choices); anything else falls back to extension sniffing
+ATTACHMENT_TYPES = frozenset(ATTACHMENT_TYPE_BY_EXTENSION.values()) | {'other'}
+
+# Prompt templates for attachment-only messages; the shared prefix of the
+# context variants is computed once by the handler rather than being
+# re-interpolated into every branch
+ATTACHMENT_PROMPTS = {
+    'pdf': "I've uploaded a PDF document: {name}. Can you help me with it?",
+    'image': "I've uploaded an image: {name}.",
+    'document': "I've uploaded a document: {name}. Can you help me with it?",
+}
+DEFAULT_ATTACHMENT_PROMPT = "I've uploaded a file: {name}."
+
+CONTEXT_ATTACHMENT_PROMPTS = {
+    'pdf': (
+        "I've uploaded a PDF document: {name}. Please analyze this file in the "
+        "context of our previous conversation, this specific message (including "
+        "its intent, keywords, entities), and all previous interactions about it."
+    ),
+    'image': "I've uploaded an image: {name}. How does this relate to what we were discussing?",
+    'document': "I've uploaded a document: {name}. Please review this in the context of our previous conversation.",
+}
+DEFAULT_CONTEXT_ATTACHMENT_PROMPT = (
+    "I've uploaded a file: {name}. Please help me understand how this relates to our discussion."
+)
+
+# Media directories are created once at import instead of per upload;
+# open_upload_destination recreates them if the tree is removed at runtime
+ATTACHMENTS_DIR = os.path.join(settings.MEDIA_ROOT, 'attachments')
+os.makedirs(settings.VOICE_FILES_DIR, exist_ok=True)
+os.makedirs(ATTACHMENTS_DIR, exist_ok=True)
+
+
+def open_upload_destination(file_path, directory):
+    """
+    Open file_path for writing, recreating directory if it was removed.
+
+    Upload writes stay synchronous on purpose: the app runs under WSGI
+    with a thread per request, so there is no event loop to block, and
+    uploads are capped at 10 MB so each write is a handful of syscalls.
+    Revisit (aiofiles or similar) only if the project moves to ASGI.
+    """
+    try:
+        return open(file_path, 'wb+')
+    except FileNotFoundError:
+        os.makedirs(directory, exist_ok=True)
+        return open(file_path, 'wb+')
+
+# How many recent messages to load when building LLM conversation history;
+# keeps the per-turn history fetch bounded as conversations grow
+HISTORY_WINDOW = 20
+
+# TTL for the cached history window; correctness comes from the
+# total_messages-derived key, the TTL just bounds cache growth
+HISTORY_CACHE_TTL = 3600
+
+# TTL for the pending-OTP pointer; matches the 10 minute OTP expiry
+OTP_CACHE_TTL = 600
+
+
+def chat_message_payload(message, request):
+    """
+    Hand-built equivalent of ChatMessageSerializer.data for freshly
+    created messages on the send path - field values are already in hand,
+    so DRF's per-field reflection is pure overhead there.
+    """
+    return {
+        'id': str(message.id),
+        'message_type': message.message_type,
+        'audio_file': _media_url(request, 'voice_recordings', message.audio_file),
+        'transcribed_text': message.transcribed_text,
+        'attachment_file': _media_url(request, 'attachments', message.attachment_file),
+        'attachment_type': message.attachment_type,
+        'attachment_name': message.attachment_name,
+        'attachment_size': message.attachment_size,
+        'response_text': message.response_text,
+        'intent': message.intent,
+        'keywords': message.keywords,
+        'entities': message.entities,
+        'domain_terms': message.domain_terms,
+        'action_items': message.action_items,
+        'topics': message.topics,
+        'created_at': message.created_at.isoformat(),
+    }
+
+
+def _media_url(request, subdir, file_path):
+    """Mirror the serializer's path-to-media-URL conversion"""
+    if not file_path:
+        return None
+    url = f'/media/{subdir}/{os.path.basename(file_path)}'
+    return request.build_absolute_uri(url) if request else url
+
+
+def get_verified_phone(request):
+    """
+    Return (phone_number, None) for a verified session, or (None, 401
+    Response) otherwise. Centralises the session check that every
+    protected view used to repeat inline.
+    """
+    phone_number = request.session.get('phone_number')
+    verified = request.session.get('verified', False)
+
+    if not phone_number or not verified:
+        return None, Response(
+            {'error': 'Not authenticated. Please verify your phone number.'},
+            status=status.HTTP_401_UNAUTHORIZED
+        )
+    return phone_number, None
+
+
+def fetch_history_window(conversation):
+    """
+    Fetch the last HISTORY_WINDOW messages of a conversation in
+    chronological order, pulling only the columns history building needs.
+
+    Cached keyed on (conversation id, total_messages): the counter is
+    bumped whenever messages are appended, so a stale window can never be
+    served and no explicit invalidation is needed.
+    """
+    cache_key = f"chat:history:{conversation.id}:{conversation.total_messages}"
+    recent = cache.get(cache_key)
+    if recent is not None:
+        return recent
+
+    recent = list(
+        ChatMessage.objects.filter(conversation=conversation)
+        .order_by('-created_at')
+        .only('message_type', 'transcribed_text', 'response_text')[:HISTORY_WINDOW]
+    )
+    recent.reverse()
+    cache.set(cache_key, recent, HISTORY_CACHE_TTL)
+    return recent
+
+
+def advance_history_window(conversation, previous_messages, *new_messages):
+    """
+    Seed the cache entry the next turn will read by appending the freshly
+    created messages to the window already in hand - the follow-up
+    request then skips the history query entirely instead of refetching
+    the same rows shifted by one turn.
+    """
+    window = (list(previous_messages) + list(new_messages))[-HISTORY_WINDOW:]
+    next_total = conversation.total_messages + len(new_messages)
+    cache.set(
+        f"chat:history:{conversation.id}:{next_total}",
+        window,
+        HISTORY_CACHE_TTL,
+    )
+
 
 class VoiceUploadView(APIView):
     parser_classes = (MultiPartParser, FormParser)
     
     def post(self, request):
-        logger.info(f"Received upload request")
+        logger.info("Received upload request")
         serializer = VoiceUploadSerializer(data=request.data)
         
         if not serializer.is_valid():
-            logger.error(f"Validation errors: {serializer.errors}")
+            logger.error("Validation errors: %s", serializer.errors)
             return Response({'error': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
         
         audio_file = serializer.validated_data['audio_file']
-        
-        voice_request = VoiceRequest.objects.create(
-            file_size=audio_file.size,
-            file_format=audio_file.name.split('.')[-1],
-            status='processing',
-            user_ip=self.get_client_ip(request),
-            user_agent=request.META.get('HTTP_USER_AGENT', '')
-        )
-        
+
+        # Compute the extension once and re-check the allow-list before it
+        # is ever used to build a filename on disk
+        file_extension = os.path.splitext(audio_file.name)[1].lower().lstrip('.')
+        if file_extension not in ALLOWED_AUDIO_EXTENSIONS:
+            return Response(
+                {'error': f'Unsupported audio format: {file_extension}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # Generate the id locally so the audio file can be named before the
+        # row exists; the happy path is then a single INSERT instead of
+        # create + save round-trips
+        request_id = uuid.uuid4()
+        request_fields = {
+            'id': request_id,
+            'file_size': audio_file.size,
+            'file_format': file_extension,
+            'user_ip': self.get_client_ip(request),
+            'user_agent': request.META.get('HTTP_USER_AGENT', ''),
+        }
+
+        voice_request = None
         try:
-            # Save audio file
-            file_path = self.save_audio_file(audio_file, voice_request.id)
-            voice_request.audio_file = file_path
-            voice_request.save()
-            
-            # Step 1: Transcribe audio to text
-            speech_service = SpeechToTextService()
-            transcribed_text, error = speech_service.transcribe_audio(file_path)
-            
-            if error:
-                voice_request.status = 'failed'
-                voice_request.error_message = error
-                voice_request.save()
-                return Response(
-                    {'id': str(voice_request.id), 'status': 'failed', 'error': error},
-                    status=status.HTTP_400_BAD_REQUEST
+            file_path = self.save_audio_file(audio_file, request_id, file_extension)
+            voice_request = VoiceRequest.objects.create(
+                audio_file=file_path,
+                status='processing',
+                **request_fields
+            )
+
+            # Transcription, intent classification, and entity extraction run
+            # in Celery workers; clients poll VoiceRequestDetailView for status
+            process_voice_request(request_id)
+
+            return Response(
+                {'id': str(request_id), 'status': voice_request.status},
+                status=status.HTTP_202_ACCEPTED
+            )
+
+        except Exception as e:
+            logger.error("Error processing voice request: %s", e)
+            if voice_request is None:
+                VoiceRequest.objects.create(
+                    status='failed', error_message=str(e), **request_fields
                 )
-            
-            voice_request.transcribed_text = transcribed_text
-            voice_request.save()
-            
-            # Step 2: Classify intent
-            intent_service = IntentClassifierService()
-            intent, confidence, summary, error = intent_service.classify_intent(transcribed_text)
-            
-            if error:
-                logger.warning(f"Intent classification warning: {error}")
-            
-            voice_request.intent = intent
-            voice_request.intent_confidence = confidence
-            voice_request.intent_summary = summary
-            
-            # Step 3: Extract entities and key terms (NEW)
-            entity_service = EntityExtractionService()
-            entities, error = entity_service.extract_entities(transcribed_text)
-            
-            if error:
-                logger.warning(f"Entity extraction warning: {error}")
             else:
-                voice_request.keywords = entities.get('keywords', [])
-                voice_request.entities = entities.get('entities', [])
-                voice_request.domain_terms = entities.get('domain_terms', [])
-                voice_request.action_items = entities.get('action_items', [])
-                voice_request.topics = entities.get('topics', [])
-            
-            # Mark as completed
-            voice_request.status = 'completed'
-            voice_request.processed_at = timezone.now()
-            voice_request.save()
-            
-            response_serializer = VoiceRequestSerializer(voice_request)
-            return Response(response_serializer.data, status=status.HTTP_201_CREATED)
-            
-        except Exception as e:
-            logger.error(f"Error processing voice request: {str(e)}")
-            voice_request.status = 'failed'
-            voice_request.error_message = str(e)
-            voice_request.save()
+                voice_request.status = 'failed'
+                voice_request.error_message = str(e)
+                voice_request.save(update_fields=['status', 'error_message', 'updated_at'])
             return Response(
-                {'id': str(voice_request.id), 'status': 'failed', 'error': 'Internal server error'},
+                {'id': str(request_id), 'status': 'failed', 'error': 'Internal server error'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     
-    def save_audio_file(self, audio_file, request_id):
-        os.makedirs(settings.VOICE_FILES_DIR, exist_ok=True)
-        file_extension = audio_file.name.split('.')[-1]
+    def save_audio_file(self, audio_file, request_id, file_extension):
         filename = f"{request_id}.{file_extension}"
         file_path = os.path.join(settings.VOICE_FILES_DIR, filename)
-        
-        with open(file_path, 'wb+') as destination:
-            for chunk in audio_file.chunks():
-                destination.write(chunk)
+
+        # O_EXCL: the filename is the request id, so an existing file can
+        # only mean a collision - fail instead of silently overwriting
+        try:
+            fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o640)
+        except FileNotFoundError:
+            os.makedirs(settings.VOICE_FILES_DIR, exist_ok=True)
+            fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o640)
+        with os.fdopen(fd, 'wb') as destination:
+            shutil.copyfileobj(audio_file, destination, length=UPLOAD_CHUNK_SIZE)
         return file_path
     
     def get_client_ip(self, request):
@@ -135,14 +300,66 @@ class VoiceUploadView(APIView):
 
 class VoiceRequestDetailView(APIView):
     def get(self, request, request_id):
+        # Clients poll this endpoint while a request is processing, so check a
+        # lightweight one-column ETag probe before fetching/serializing the row
+        updated_at = VoiceRequest.objects.filter(
+            id=request_id
+        ).values_list('updated_at', flat=True).first()
+
+        if updated_at is None:
+            return Response({'error': 'Voice request not found'}, status=status.HTTP_404_NOT_FOUND)
+
+        etag = f'"{updated_at.timestamp()}"'
+
+        if request.META.get('HTTP_IF_NONE_MATCH') == etag:
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+
         try:
             voice_request = VoiceRequest.objects.get(id=request_id)
             serializer = VoiceRequestSerializer(voice_request)
-            return Response(serializer.data)
+            response = Response(serializer.data)
+            response['ETag'] = etag
+            return response
         except VoiceRequest.DoesNotExist:
             return Response({'error': 'Voice request not found'}, status=status.HTTP_404_NOT_FOUND)
 
 
+def encode_list_cursor(voice_request):
+    """Opaque keyset cursor for the list view: created_at plus id."""
+    raw = f"{voice_request.created_at.isoformat()}|{voice_request.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_list_cursor(cursor):
+    """Decode an ``after`` cursor; returns (created_at, id) or None."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        timestamp, _, row_id = raw.partition('|')
+        return datetime.fromisoformat(timestamp), uuid.UUID(row_id)
+    except (ValueError, binascii.Error):
+        return None
+
+
+def estimated_voice_request_count():
+    """
+    Planner estimate of the VoiceRequest row count from pg_class.
+
+    Autovacuum keeps reltuples current enough for a pagination total, and
+    reading it avoids the COUNT(*) scan on every unfiltered list page.
+    Falls back to an exact count when the estimate is unavailable (a
+    never-analyzed table reports -1).
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+            [VoiceRequest._meta.db_table],
+        )
+        row = cursor.fetchone()
+    if row is not None and row[0] >= 0:
+        return row[0]
+    return VoiceRequest.objects.count()
+
+
 class VoiceRequestListView(APIView):
     def get(self, request):
         queryset = VoiceRequest.objects.all()
@@ -169,20 +386,69 @@ class VoiceRequestListView(APIView):
         # Pagination
         page = int(request.query_params.get('page', 1))
         page_size = int(request.query_params.get('page_size', 20))
-        
+
+        # Keyset pagination via ?after=<cursor>: stays O(page_size) at any
+        # depth where OFFSET must scan and discard every earlier row, and
+        # needs no COUNT(*). Page-number pagination remains for existing
+        # clients.
+        after = request.query_params.get('after')
+        if after is not None:
+            cursor = decode_list_cursor(after)
+            if cursor is None:
+                return Response(
+                    {'error': 'Invalid after cursor'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            cursor_ts, cursor_id = cursor
+            rows = list(queryset.filter(
+                Q(created_at__lt=cursor_ts) |
+                Q(created_at=cursor_ts, id__lt=cursor_id)
+            ).order_by('-created_at', '-id').only(
+                'id', 'file_size', 'file_format', 'intent', 'intent_confidence',
+                'status', 'created_at', 'processed_at'
+            )[:page_size + 1])
+
+            has_more = len(rows) > page_size
+            rows = rows[:page_size]
+            serializer = VoiceRequestListSerializer(rows, many=True)
+            return Response({
+                'page_size': page_size,
+                'results': serializer.data,
+                'next_cursor': encode_list_cursor(rows[-1]) if has_more else None,
+            })
+
         start = (page - 1) * page_size
         end = start + page_size
-        
-        total_count = queryset.count()
-        voice_requests = queryset[start:end]
-        
-        serializer = VoiceRequestSerializer(voice_requests, many=True)
-        
+
+        # Only pull the columns the list serializer exposes - skips the
+        # transcript and entity ArrayFields, which dominate row size
+        voice_requests = list(queryset.only(
+            'id', 'file_size', 'file_format', 'intent', 'intent_confidence',
+            'status', 'created_at', 'processed_at'
+        )[start:end])
+
+        # A short first page already tells us the total; skip the COUNT(*)
+        if page == 1 and len(voice_requests) < page_size:
+            total_count = len(voice_requests)
+        elif not any([status_filter, intent_filter, keyword_filter, topic_filter]):
+            total_count = estimated_voice_request_count()
+        else:
+            total_count = queryset.count()
+
+        serializer = VoiceRequestListSerializer(voice_requests, many=True)
+
+        # next_cursor lets page-number clients switch to keyset pagination
+        # mid-listing
+        has_more = total_count > end
         return Response({
             'count': total_count,
             'page': page,
             'page_size': page_size,
-            'results': serializer.data
+            'results': serializer.data,
+            'next_cursor': (
+                encode_list_cursor(voice_requests[-1])
+                if has_more and voice_requests else None
+            ),
         })
 
 
@@ -206,7 +472,7 @@ class SendOTPView(APIView):
         success, message, message_id = OTPService.send_otp(email, otp_code)
 
         if not success:
-            logger.error(f"Failed to send OTP to {email}: {message}")
+            logger.error("Failed to send OTP to %s: %s", email, message)
             return Response(
                 {'error': message},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -219,7 +485,12 @@ class SendOTPView(APIView):
             expires_at=OTPService.get_otp_expiration()
         )
 
-        logger.info(f"OTP created for {email}")
+        # Remember which row is the pending OTP so verification can fetch
+        # it by pk instead of an ORDER BY created_at scan. The row stays
+        # authoritative for code, expiry, and attempt counting
+        cache.set(f"otp:pending:{email}", str(phone_verification.id), OTP_CACHE_TTL)
+
+        logger.info("OTP created for %s", email)
 
         # Build response
         response_data = {
@@ -232,7 +503,7 @@ class SendOTPView(APIView):
         if settings.DEBUG:
             response_data['otp_code'] = otp_code
             response_data['dev_mode'] = True
-            logger.warning(f"🔐 DEV MODE - OTP Code for {email}: {otp_code}")
+            logger.warning("🔐 DEV MODE - OTP Code for %s: %s", email, otp_code)
 
         return Response(response_data, status=status.HTTP_200_OK)
 
@@ -250,11 +521,21 @@ class VerifyOTPView(APIView):
         otp_code = serializer.validated_data['otp_code']
 
         try:
-            # Find the most recent OTP for this email
-            phone_verification = PhoneVerification.objects.filter(
-                phone_number=email,
-                is_verified=False
-            ).order_by('-created_at').first()
+            # The send view caches the pending OTP's pk; a hit turns the
+            # lookup into a primary-key fetch. Fall back to the newest
+            # unverified row when the cache entry is gone (restart, TTL)
+            phone_verification = None
+            pending_id = cache.get(f"otp:pending:{email}")
+            if pending_id:
+                phone_verification = PhoneVerification.objects.filter(
+                    id=pending_id,
+                    is_verified=False
+                ).first()
+            if phone_verification is None:
+                phone_verification = PhoneVerification.objects.filter(
+                    phone_number=email,
+                    is_verified=False
+                ).order_by('-created_at').first()
 
             if not phone_verification:
                 return Response(
@@ -276,8 +557,9 @@ class VerifyOTPView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-            # Verify OTP code
-            if phone_verification.otp_code != otp_code:
+            # Verify OTP code; constant_time_compare keeps the comparison
+            # independent of how many leading digits match
+            if not constant_time_compare(phone_verification.otp_code, otp_code):
                 phone_verification.verification_attempts += 1
                 phone_verification.save()
 
@@ -289,21 +571,25 @@ class VerifyOTPView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-            # OTP is valid - mark as verified
-            phone_verification.is_verified = True
-            phone_verification.verified_at = timezone.now()
-            phone_verification.save()
-
-            # Check if user has any conversations, create one if not
-            conversation = ChatConversation.objects.filter(
-                phone_number=email
-            ).first()
+            # OTP is valid - mark verified and ensure a conversation exists
+            # in one commit; get_or_create closes the filter+create race
+            # between concurrent verifications
+            with transaction.atomic():
+                phone_verification.is_verified = True
+                phone_verification.verified_at = timezone.now()
+                phone_verification.save()
 
-            if not conversation:
-                conversation = ChatConversation.objects.create(
-                    phone_number=email,
-                    title="New Chat"
-                )
+                try:
+                    conversation, _ = ChatConversation.objects.get_or_create(
+                        phone_number=email,
+                        defaults={'title': 'New Chat'}
+                    )
+                except ChatConversation.MultipleObjectsReturned:
+                    # Users may legitimately hold several conversations
+                    # (no unique constraint) - reuse the most recent one
+                    conversation = ChatConversation.objects.filter(
+                        phone_number=email
+                    ).first()
 
             # Create session
             request.session['phone_number'] = email
@@ -311,7 +597,7 @@ class VerifyOTPView(APIView):
             request.session['verified'] = True
             request.session['conversation_id'] = str(conversation.id)
 
-            logger.info(f"Successfully verified OTP for {email}")
+            logger.info("Successfully verified OTP for %s", email)
 
             return Response({
                 'message': 'OTP verified successfully',
@@ -320,7 +606,7 @@ class VerifyOTPView(APIView):
             }, status=status.HTTP_200_OK)
 
         except Exception as e:
-            logger.error(f"Error verifying OTP: {str(e)}")
+            logger.error("Error verifying OTP: %s", e)
             return Response(
                 {'error': 'An error occurred during verification'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -362,14 +648,9 @@ class SendChatMessageView(APIView):
 
     def post(self, request):
         # Check session
-        phone_number = request.session.get('phone_number')
-        verified = request.session.get('verified', False)
-
-        if not phone_number or not verified:
-            return Response(
-                {'error': 'Not authenticated. Please verify your phone number.'},
-                status=status.HTTP_401_UNAUTHORIZED
-            )
+        phone_number, auth_error = get_verified_phone(request)
+        if auth_error:
+            return auth_error
 
         serializer = SendChatMessageSerializer(data=request.data)
 
@@ -378,16 +659,31 @@ class SendChatMessageView(APIView):
 
         audio_file = serializer.validated_data['audio_file']
 
-        try:
-            # Get conversation
-            conversation = ChatConversation.objects.get(phone_number=phone_number)
+        # Same extension allow-list as VoiceUploadView: the extension names
+        # the file on disk, so only known audio formats may pass through
+        file_extension = os.path.splitext(audio_file.name)[1].lower().lstrip('.')
+        if file_extension not in ALLOWED_AUDIO_EXTENSIONS:
+            return Response(
+                {'error': f'Unsupported audio format: {file_extension}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
-            # Save audio file
-            file_path = self.save_audio_file(audio_file, conversation.id)
+        try:
+            # Get conversation - the pk plus the message counter that keys
+            # the cached history window
+            conversation = ChatConversation.objects.only(
+                'id', 'total_messages'
+            ).get(phone_number=phone_number)
+
+            # Read the upload once: the same buffer is written to disk for
+            # storage and sent to the speech service, instead of writing the
+            # file and re-reading it for upload
+            audio_bytes = audio_file.read()
+            file_path = self.save_audio_file(audio_bytes, audio_file.name, conversation.id)
 
             # Transcribe audio
-            speech_service = SpeechToTextService()
-            transcribed_text, error = speech_service.transcribe_audio(file_path)
+            speech_service = get_speech_service()
+            transcribed_text, error = speech_service.transcribe_audio_bytes(audio_bytes)
 
             if error:
                 return Response(
@@ -395,18 +691,49 @@ class SendChatMessageView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-            # Extract entities and classify intent
-            entity_service = EntityExtractionService()
-            intent_service = IntentClassifierService()
+            # Classify intent and extract entities concurrently - both are
+            # independent LLM round-trips, so wall-clock is max() not sum().
+            # Skip both for silent/failed-ASR uploads: there is nothing
+            # meaningful to classify in an empty transcript
+            intent, intent_error = None, None
+            entities_data, entity_error = {}, None
+
+            if transcribed_text and len(transcribed_text.strip()) >= 3:
+                entity_service = get_entity_service()
+                intent_service = get_intent_service()
+
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    intent_future = executor.submit(intent_service.classify_intent, transcribed_text)
+                    entities_future = executor.submit(entity_service.extract_entities, transcribed_text)
+
+                    intent, confidence, summary, intent_error = intent_future.result()
+                    entities_data, entity_error = entities_future.result()
+
+            # Build conversation history from the recent window, before
+            # inserting the new message - the current turn is passed to the
+            # chat service separately, so fetching it back would only
+            # duplicate it in the prompt
+            chat_service = get_chat_service()
+            previous_messages = fetch_history_window(conversation)
+            conversation_history = chat_service.build_conversation_history(previous_messages)
 
-            # Get intent
-            intent, confidence, summary, intent_error = intent_service.classify_intent(transcribed_text)
+            # Generate AI response - it needs only the history window and
+            # the transcript, so nothing has to be persisted before it runs
+            response_text, error = chat_service.generate_response(
+                conversation_history,
+                transcribed_text
+            )
 
-            # Get entities
-            entities_data, entity_error = entity_service.extract_entities(transcribed_text)
+            if error:
+                logger.error("Chat response error: %s", error)
+                response_text = "I'm sorry, I'm having trouble responding right now. Please try again."
 
-            # Create user message with entity data
-            user_message = ChatMessage.objects.create(
+            # Persist both messages and bump the conversation counters in
+            # one transaction (one commit/fsync instead of three), so a
+            # reader never sees a user turn without its reply. The LLM
+            # calls stay outside so no transaction is held open across
+            # network I/O.
+            user_message = ChatMessage(
                 conversation=conversation,
                 message_type='user',
                 audio_file=file_path,
@@ -418,40 +745,34 @@ class SendChatMessageView(APIView):
                 action_items=entities_data.get('action_items', []) if not entity_error else [],
                 topics=entities_data.get('topics', []) if not entity_error else []
             )
-
-            # Build conversation history
-            previous_messages = ChatMessage.objects.filter(
-                conversation=conversation
-            ).order_by('created_at')
-
-            chat_service = ChatService()
-            conversation_history = chat_service.build_conversation_history(previous_messages)
-
-            # Generate AI response
-            response_text, error = chat_service.generate_response(
-                conversation_history,
-                transcribed_text
-            )
-
-            if error:
-                logger.error(f"Chat response error: {error}")
-                response_text = "I'm sorry, I'm having trouble responding right now. Please try again."
-
-            # Create bot message
-            bot_message = ChatMessage.objects.create(
+            bot_message = ChatMessage(
                 conversation=conversation,
                 message_type='bot',
                 response_text=response_text
             )
 
-            # Update conversation metadata
-            conversation.total_messages += 2
-            conversation.save()
+            with transaction.atomic():
+                # One multi-row INSERT for both turns; the UUID pks are
+                # generated client-side so nothing needs to come back from
+                # the database
+                ChatMessage.objects.bulk_create([user_message, bot_message])
+
+                # An F() expression makes the increment one atomic UPDATE
+                # with no read-modify-write race
+                ChatConversation.objects.filter(id=conversation.id).update(
+                    total_messages=F('total_messages') + 2,
+                    last_activity=timezone.now()  # queryset.update skips auto_now
+                )
 
-            # Return both messages
+            advance_history_window(
+                conversation, previous_messages, user_message, bot_message
+            )
+
+            # Return both messages; the payload helper skips the DRF
+            # serializer pass since every field value is already in hand
             return Response({
-                'user_message': ChatMessageSerializer(user_message, context={'request': request}).data,
-                'bot_message': ChatMessageSerializer(bot_message, context={'request': request}).data
+                'user_message': chat_message_payload(user_message, request),
+                'bot_message': chat_message_payload(bot_message, request)
             }, status=status.HTTP_201_CREATED)
 
         except ChatConversation.DoesNotExist:
@@ -460,23 +781,20 @@ class SendChatMessageView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
-            logger.error(f"Error sending chat message: {str(e)}")
+            logger.error("Error sending chat message: %s", e)
             return Response(
                 {'error': 'An error occurred while processing your message'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-    def save_audio_file(self, audio_file, conversation_id):
-        """Save audio file to media directory"""
-        import uuid
-        os.makedirs(settings.VOICE_FILES_DIR, exist_ok=True)
-        file_extension = audio_file.name.split('.')[-1]
-        filename = f"chat_{conversation_id}_{uuid.uuid4()}.{file_extension}"
+    def save_audio_file(self, audio_bytes, original_name, conversation_id):
+        """Save an already-read audio payload to the media directory"""
+        file_extension = os.path.splitext(original_name)[1].lower().lstrip('.')
+        filename = f"chat_{conversation_id}_{uuid.uuid4().hex}.{file_extension}"
         file_path = os.path.join(settings.VOICE_FILES_DIR, filename)
 
-        with open(file_path, 'wb+') as destination:
-            for chunk in audio_file.chunks():
-                destination.write(chunk)
+        with open_upload_destination(file_path, settings.VOICE_FILES_DIR) as destination:
+            destination.write(audio_bytes)
         return file_path
 
 
@@ -485,22 +803,29 @@ class ChatHistoryView(APIView):
 
     def get(self, request):
         # Check session
-        phone_number = request.session.get('phone_number')
-        verified = request.session.get('verified', False)
-
-        if not phone_number or not verified:
-            return Response(
-                {'error': 'Not authenticated. Please verify your phone number.'},
-                status=status.HTTP_401_UNAUTHORIZED
-            )
+        phone_number, auth_error = get_verified_phone(request)
+        if auth_error:
+            return auth_error
 
         try:
             conversation = ChatConversation.objects.get(phone_number=phone_number)
+
+            # Project only the serialized columns and iterate in chunks so
+            # a long conversation is never held in memory twice (rows plus
+            # their serialized dicts)
             messages = ChatMessage.objects.filter(
                 conversation=conversation
-            ).order_by('created_at')
+            ).order_by('created_at').only(
+                'id', 'message_type', 'audio_file', 'transcribed_text',
+                'attachment_file', 'attachment_type', 'attachment_name',
+                'attachment_size', 'response_text', 'intent', 'keywords',
+                'entities', 'domain_terms', 'action_items', 'topics',
+                'created_at'
+            )
 
-            serializer = ChatMessageSerializer(messages, many=True, context={'request': request})
+            serializer = ChatMessageSerializer(
+                messages.iterator(chunk_size=500), many=True, context={'request': request}
+            )
 
             return Response({
                 'conversation_id': str(conversation.id),
@@ -525,18 +850,15 @@ class ConversationsListView(APIView):
 
     def get(self, request):
         # Check session
-        phone_number = request.session.get('phone_number')
-        verified = request.session.get('verified', False)
-
-        if not phone_number or not verified:
-            return Response(
-                {'error': 'Not authenticated'},
-                status=status.HTTP_401_UNAUTHORIZED
-            )
+        phone_number, auth_error = get_verified_phone(request)
+        if auth_error:
+            return auth_error
 
+        # The serializer nests each conversation's messages; prefetch them in
+        # one query instead of one per conversation
         conversations = ChatConversation.objects.filter(
             phone_number=phone_number
-        ).order_by('-last_activity')
+        ).prefetch_related('messages').order_by('-last_activity')
 
         serializer = ChatConversationSerializer(conversations, many=True)
 
@@ -550,14 +872,9 @@ class ConversationDetailView(APIView):
 
     def get(self, request, conversation_id):
         # Check session
-        phone_number = request.session.get('phone_number')
-        verified = request.session.get('verified', False)
-
-        if not phone_number or not verified:
-            return Response(
-                {'error': 'Not authenticated'},
-                status=status.HTTP_401_UNAUTHORIZED
-            )
+        phone_number, auth_error = get_verified_phone(request)
+        if auth_error:
+            return auth_error
 
         try:
             conversation = ChatConversation.objects.get(
@@ -565,11 +882,20 @@ class ConversationDetailView(APIView):
                 phone_number=phone_number
             )
 
+            # Same projection + chunked iteration as ChatHistoryView
             messages = ChatMessage.objects.filter(
                 conversation=conversation
-            ).order_by('created_at')
+            ).order_by('created_at').only(
+                'id', 'message_type', 'audio_file', 'transcribed_text',
+                'attachment_file', 'attachment_type', 'attachment_name',
+                'attachment_size', 'response_text', 'intent', 'keywords',
+                'entities', 'domain_terms', 'action_items', 'topics',
+                'created_at'
+            )
 
-            message_serializer = ChatMessageSerializer(messages, many=True, context={'request': request})
+            message_serializer = ChatMessageSerializer(
+                messages.iterator(chunk_size=500), many=True, context={'request': request}
+            )
 
             return Response({
                 'id': str(conversation.id),
@@ -588,14 +914,9 @@ class ConversationDetailView(APIView):
 
     def delete(self, request, conversation_id):
         """Delete a conversation"""
-        phone_number = request.session.get('phone_number')
-        verified = request.session.get('verified', False)
-
-        if not phone_number or not verified:
-            return Response(
-                {'error': 'Not authenticated'},
-                status=status.HTTP_401_UNAUTHORIZED
-            )
+        phone_number, auth_error = get_verified_phone(request)
+        if auth_error:
+            return auth_error
 
         try:
             conversation = ChatConversation.objects.get(
@@ -620,14 +941,9 @@ class NewConversationView(APIView):
     """Create a new conversation"""
 
     def post(self, request):
-        phone_number = request.session.get('phone_number')
-        verified = request.session.get('verified', False)
-
-        if not phone_number or not verified:
-            return Response(
-                {'error': 'Not authenticated'},
-                status=status.HTTP_401_UNAUTHORIZED
-            )
+        phone_number, auth_error = get_verified_phone(request)
+        if auth_error:
+            return auth_error
 
         # Create new conversation
         conversation = ChatConversation.objects.create(
@@ -648,14 +964,9 @@ class SendChatMessageModernView(APIView):
 
     def post(self, request):
         # Check session
-        phone_number = request.session.get('phone_number')
-        verified = request.session.get('verified', False)
-
-        if not phone_number or not verified:
-            return Response(
-                {'error': 'Not authenticated'},
-                status=status.HTTP_401_UNAUTHORIZED
-            )
+        phone_number, auth_error = get_verified_phone(request)
+        if auth_error:
+            return auth_error
 
         serializer = SendChatMessageSerializer(data=request.data)
 
@@ -664,16 +975,32 @@ class SendChatMessageModernView(APIView):
 
         audio_file = serializer.validated_data.get('audio_file')
         attachment_file = serializer.validated_data.get('attachment_file')
+
+        if audio_file:
+            # Same extension allow-list as VoiceUploadView
+            file_extension = os.path.splitext(audio_file.name)[1].lower().lstrip('.')
+            if file_extension not in ALLOWED_AUDIO_EXTENSIONS:
+                return Response(
+                    {'error': f'Unsupported audio format: {file_extension}'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
         conversation_id = request.data.get('conversation_id')
         context_message_id = request.data.get('context_message_id')  # For context-aware file uploads
 
         # Debug logging
-        logger.info(f"SendChatMessageModernView received: conversation_id={conversation_id}, context_message_id={context_message_id}, has_audio={bool(audio_file)}, has_attachment={bool(attachment_file)}")
+        logger.info(
+            "SendChatMessageModernView received: conversation_id=%s, context_message_id=%s, has_audio=%s, has_attachment=%s",
+            conversation_id, context_message_id, bool(audio_file), bool(attachment_file)
+        )
 
         try:
             # Get or create conversation
             if conversation_id:
-                conversation = ChatConversation.objects.get(
+                # Only the columns this view reads; counters and title are
+                # updated via queryset.update() below
+                conversation = ChatConversation.objects.only(
+                    'id', 'total_messages', 'title', 'conversation_summary'
+                ).get(
                     id=conversation_id,
                     phone_number=phone_number
                 )
@@ -688,34 +1015,37 @@ class SendChatMessageModernView(APIView):
             # SEPARATE FLOW: Context Sidebar Upload (NO conversation messages)
             # ============================================================
             if context_message_id:
-                logger.info(f"🔀 ROUTING TO CONTEXT HANDLER - context_message_id={context_message_id}")
+                logger.info("🔀 ROUTING TO CONTEXT HANDLER - context_message_id=%s", context_message_id)
                 return self.handle_context_question_upload(
-                    conversation, context_message_id, audio_file, attachment_file
+                    request, conversation, context_message_id, audio_file, attachment_file
                 )
 
             # If we reach here, context_message_id was None/empty
-            logger.info(f"📝 ROUTING TO NORMAL FLOW - Creating conversation messages")
+            logger.info("📝 ROUTING TO NORMAL FLOW - Creating conversation messages")
 
             # ============================================================
             # NORMAL FLOW: Main conversation thread (creates messages)
             # ============================================================
 
-            # Save audio file if provided
+            # Save audio file if provided. The transcription round-trip
+            # runs in a worker thread so a simultaneous attachment save
+            # happens during the wait instead of after it
             file_path = None
             transcribed_text = ""
+            transcription_future = None
+            transcription_executor = None
 
             if audio_file:
-                file_path = self.save_audio_file(audio_file, conversation.id)
-
-                # Transcribe audio
-                speech_service = SpeechToTextService()
-                transcribed_text, error = speech_service.transcribe_audio(file_path)
-
-                if error:
-                    return Response(
-                        {'error': f'Transcription failed: {error}'},
-                        status=status.HTTP_400_BAD_REQUEST
-                    )
+                # Single pass over the upload: write the buffer to disk and
+                # send the same bytes to the speech service
+                audio_bytes = audio_file.read()
+                file_path = self.save_audio_file(audio_bytes, audio_file.name, conversation.id)
+
+                speech_service = get_speech_service()
+                transcription_executor = ThreadPoolExecutor(max_workers=1)
+                transcription_future = transcription_executor.submit(
+                    speech_service.transcribe_audio_bytes, audio_bytes
+                )
 
             # Save attachment file if provided
             attachment_path = None
@@ -724,23 +1054,45 @@ class SendChatMessageModernView(APIView):
             attachment_size = None
 
             if attachment_file:
-                attachment_path, attachment_type = self.save_attachment_file(attachment_file, conversation.id)
+                attachment_path, attachment_type = self.save_attachment_file(
+                    attachment_file, conversation.id,
+                    declared_type=request.data.get('attachment_type')
+                )
                 attachment_name = attachment_file.name
                 attachment_size = attachment_file.size
 
+            if transcription_future is not None:
+                transcribed_text, error = transcription_future.result()
+                transcription_executor.shutdown()
+
+                if error:
+                    return Response(
+                        {'error': f'Transcription failed: {error}'},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+
             # Extract entities and classify intent (only if we have transcribed text)
             intent = None
             entities_data = {}
 
             if transcribed_text:
-                entity_service = EntityExtractionService()
-                intent_service = IntentClassifierService()
-
-                # Get intent
-                intent, confidence, summary, intent_error = intent_service.classify_intent(transcribed_text)
-
-                # Get entities
-                entities_data, entity_error = entity_service.extract_entities(transcribed_text)
+                entity_service = get_entity_service()
+                intent_service = get_intent_service()
+
+                # Run both LLM round-trips concurrently (no data dependency)
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    intent_future = executor.submit(intent_service.classify_intent, transcribed_text)
+                    entities_future = executor.submit(entity_service.extract_entities, transcribed_text)
+
+                    intent, confidence, summary, intent_error = intent_future.result()
+                    entities_data, entity_error = entities_future.result()
+
+            # Build conversation history from the recent window, before
+            # inserting the new message (the current turn goes to the chat
+            # service separately, so re-fetching it would duplicate it)
+            chat_service = get_chat_service()
+            previous_messages = fetch_history_window(conversation)
+            conversation_history = chat_service.build_conversation_history(previous_messages)
 
             # Create user message with entity data and attachment
             user_message = ChatMessage.objects.create(
@@ -761,33 +1113,22 @@ class SendChatMessageModernView(APIView):
             )
 
             # Generate conversation title from first message
+            new_title = None
             if conversation.total_messages == 0:
                 if transcribed_text:
-                    conversation.title = self.generate_title(transcribed_text)
+                    new_title = self.generate_title(transcribed_text)
                 elif attachment_name:
-                    conversation.title = f"Attachment: {attachment_name[:30]}..."
+                    new_title = f"Attachment: {attachment_name[:30]}..."
                 else:
-                    conversation.title = "New Chat"
-
-            # Build conversation history
-            previous_messages = ChatMessage.objects.filter(
-                conversation=conversation
-            ).order_by('created_at')
-
-            chat_service = ChatService()
-            conversation_history = chat_service.build_conversation_history(previous_messages)
+                    new_title = "New Chat"
+                conversation.title = new_title
 
             # Generate AI response (for main conversation thread)
             # If only attachment (no audio), create a contextual prompt about the attachment
             if not transcribed_text and attachment_file:
-                if attachment_type == 'pdf':
-                    user_input = f"I've uploaded a PDF document: {attachment_name}. Can you help me with it?"
-                elif attachment_type == 'image':
-                    user_input = f"I've uploaded an image: {attachment_name}."
-                elif attachment_type == 'document':
-                    user_input = f"I've uploaded a document: {attachment_name}. Can you help me with it?"
-                else:
-                    user_input = f"I've uploaded a file: {attachment_name}."
+                user_input = ATTACHMENT_PROMPTS.get(
+                    attachment_type, DEFAULT_ATTACHMENT_PROMPT
+                ).format(name=attachment_name)
             else:
                 user_input = transcribed_text
 
@@ -797,24 +1138,18 @@ class SendChatMessageModernView(APIView):
             )
 
             if error:
-                logger.error(f"Chat response error: {error}")
+                logger.error("Chat response error: %s", error)
                 response_text = "I'm sorry, I'm having trouble responding right now. Please try again."
 
             # NEW BEHAVIOR: Don't create bot message in main chat
             # Instead, create a ContextQuestion so response appears in context sidebar
-            logger.info(f"📝 Creating ContextQuestion for user message (NO bot message in main chat)")
+            logger.info("📝 Creating ContextQuestion for user message (NO bot message in main chat)")
 
             # Create question text based on input type
             if audio_file:
                 question_text = f"🎤 {transcribed_text or 'Voice message'}"
             elif attachment_file:
-                file_icon = '📎'
-                if attachment_type == 'pdf':
-                    file_icon = '📄'
-                elif attachment_type == 'image':
-                    file_icon = '🖼️'
-                elif attachment_type == 'document':
-                    file_icon = '📝'
+                file_icon = FILE_ICON_BY_TYPE.get(attachment_type, DEFAULT_FILE_ICON)
                 question_text = f"{file_icon} {transcribed_text or f'Uploaded: {attachment_name}'}"
             else:
                 question_text = transcribed_text
@@ -828,15 +1163,31 @@ class SendChatMessageModernView(APIView):
                 context_summary=conversation.conversation_summary
             )
 
-            # Update conversation metadata (only 1 message added - the user message)
-            conversation.total_messages += 1
-            conversation.save()
+            # Update conversation metadata atomically (only 1 message added -
+            # the user message); F() avoids the read-modify-write race
+            conversation_updates = {
+                'total_messages': F('total_messages') + 1,
+                'last_activity': timezone.now(),  # queryset.update skips auto_now
+            }
+            if new_title is not None:
+                # Conditional update: only claim the title while the
+                # conversation is still empty, so a concurrent first message
+                # can't overwrite a title that already won the race
+                claimed = ChatConversation.objects.filter(
+                    id=conversation.id, total_messages=0
+                ).update(title=new_title, **conversation_updates)
+                if not claimed:
+                    ChatConversation.objects.filter(id=conversation.id).update(**conversation_updates)
+            else:
+                ChatConversation.objects.filter(id=conversation.id).update(**conversation_updates)
+
+            advance_history_window(conversation, previous_messages, user_message)
 
-            logger.info(f"✅ Response stored as ContextQuestion (not in main chat)")
+            logger.info("✅ Response stored as ContextQuestion (not in main chat)")
 
             # Return user message and context question (NO bot_message)
             return Response({
-                'user_message': ChatMessageSerializer(user_message, context={'request': request}).data,
+                'user_message': chat_message_payload(user_message, request),
                 'context_question': {
                     'id': str(context_question.id),
                     'question': question_text,
@@ -853,53 +1204,63 @@ class SendChatMessageModernView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
-            logger.error(f"Error sending chat message: {str(e)}")
+            logger.error("Error sending chat message: %s", e)
             return Response(
                 {'error': 'An error occurred while processing your message'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-    def handle_context_question_upload(self, conversation, context_message_id, audio_file, attachment_file):
+    def handle_context_question_upload(self, request, conversation, context_message_id, audio_file, attachment_file):
         """
         Handle file/audio upload from context sidebar
         Does NOT create conversation messages, only creates ContextQuestion
         """
-        logger.info(f"✅ CONTEXT HANDLER STARTED - NO conversation messages will be created")
+        logger.info("✅ CONTEXT HANDLER STARTED - NO conversation messages will be created")
         try:
-            # Get the context message
-            context_message = ChatMessage.objects.get(id=context_message_id, conversation=conversation)
-            logger.info(f"📌 Context message found: type={context_message.message_type}, id={context_message_id}")
-
-            # Process audio file if provided
+            # Get the context message - just the columns the prompt build
+            # below reads
+            context_message = ChatMessage.objects.only(
+                'id', 'message_type', 'transcribed_text', 'response_text',
+                'intent', 'keywords', 'entities', 'domain_terms',
+                'action_items', 'topics'
+            ).get(id=context_message_id, conversation=conversation)
+            logger.info("📌 Context message found: type=%s, id=%s", context_message.message_type, context_message_id)
+
+            # Process audio file if provided. DRF class-based views are
+            # sync-only, so instead of async/await the transcription
+            # round-trip runs in a worker thread while this thread does the
+            # attachment save and DB reads that don't depend on it.
             file_path = None
             transcribed_text = ""
+            transcription_future = None
+            transcription_executor = None
             if audio_file:
-                file_path = self.save_audio_file(audio_file, conversation.id)
-
-                # Transcribe audio
-                speech_service = SpeechToTextService()
-                transcribed_text, error = speech_service.transcribe_audio(file_path)
-
-                if error:
-                    return Response(
-                        {'error': f'Transcription failed: {error}'},
-                        status=status.HTTP_400_BAD_REQUEST
-                    )
+                # Single pass over the upload: write the buffer to disk and
+                # send the same bytes to the speech service
+                audio_bytes = audio_file.read()
+                file_path = self.save_audio_file(audio_bytes, audio_file.name, conversation.id)
+
+                speech_service = get_speech_service()
+                transcription_executor = ThreadPoolExecutor(max_workers=1)
+                transcription_future = transcription_executor.submit(
+                    speech_service.transcribe_audio_bytes, audio_bytes
+                )
 
             # Process attachment file if provided
             attachment_path = None
             attachment_type = None
             attachment_name = None
             if attachment_file:
-                attachment_path, attachment_type = self.save_attachment_file(attachment_file, conversation.id)
+                attachment_path, attachment_type = self.save_attachment_file(
+                    attachment_file, conversation.id,
+                    declared_type=request.data.get('attachment_type')
+                )
                 attachment_name = attachment_file.name
 
             # Build context for AI response
-            # 1. Get full conversation history
-            previous_messages = ChatMessage.objects.filter(
-                conversation=conversation
-            ).order_by('created_at')
-            chat_service = ChatService()
+            # 1. Get recent conversation history (bounded window)
+            chat_service = get_chat_service()
+            previous_messages = fetch_history_window(conversation)
             conversation_history = chat_service.build_conversation_history(previous_messages)
 
             # 2. Get the selected message context with entities
@@ -921,31 +1282,46 @@ class SendChatMessageModernView(APIView):
             else:
                 context_message_text = context_message.response_text or "Previous bot response"
 
-            # 3. Get all previous context questions for this message
-            previous_questions = ContextQuestion.objects.filter(
-                message=context_message
-            ).order_by('created_at')
+            # 3. Get all previous context questions for this message - one
+            # values_list query, no model instances for two text columns
+            qa_rows = list(
+                ContextQuestion.objects.filter(message=context_message)
+                .order_by('created_at')
+                .values_list('question', 'answer')
+            )
 
+            # Build with a list + join instead of += in a loop, which copies
+            # the growing prefix on every iteration (quadratic for long
+            # question histories)
             previous_context_qa = ""
-            if previous_questions.exists():
-                previous_context_qa = "\n\nPrevious interactions about this message:\n"
-                for pq in previous_questions:
-                    previous_context_qa += f"Q: {pq.question}\nA: {pq.answer}\n"
+            if qa_rows:
+                previous_context_qa = "\n\nPrevious interactions about this message:\n" + "".join(
+                    f"Q: {q}\nA: {a}\n" for q, a in qa_rows
+                )
 
-            # Build the user prompt
+            # Join the transcription that has been running alongside the
+            # reads above
+            if transcription_future is not None:
+                transcribed_text, error = transcription_future.result()
+                transcription_executor.shutdown()
+                if error:
+                    return Response(
+                        {'error': f'Transcription failed: {error}'},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
+
+            # Build the user prompt: the shared "Regarding the message"
+            # prefix (which embeds the potentially long Q/A context) is
+            # assembled once, then the branch only formats its short tail
+            prefix = f"Regarding the message: '{context_message_text}'{previous_context_qa}\n\n"
             if not transcribed_text and attachment_file:
                 # File upload without audio
-                if attachment_type == 'pdf':
-                    user_input = f"Regarding the message: '{context_message_text}'{previous_context_qa}\n\nI've uploaded a PDF document: {attachment_name}. Please analyze this file in the context of our previous conversation, this specific message (including its intent, keywords, entities), and all previous interactions about it."
-                elif attachment_type == 'image':
-                    user_input = f"Regarding the message: '{context_message_text}'{previous_context_qa}\n\nI've uploaded an image: {attachment_name}. How does this relate to what we were discussing?"
-                elif attachment_type == 'document':
-                    user_input = f"Regarding the message: '{context_message_text}'{previous_context_qa}\n\nI've uploaded a document: {attachment_name}. Please review this in the context of our previous conversation."
-                else:
-                    user_input = f"Regarding the message: '{context_message_text}'{previous_context_qa}\n\nI've uploaded a file: {attachment_name}. Please help me understand how this relates to our discussion."
+                user_input = prefix + CONTEXT_ATTACHMENT_PROMPTS.get(
+                    attachment_type, DEFAULT_CONTEXT_ATTACHMENT_PROMPT
+                ).format(name=attachment_name)
             else:
                 # Audio/text provided
-                user_input = f"Regarding the message: '{context_message_text}'{previous_context_qa}\n\n{transcribed_text}"
+                user_input = prefix + transcribed_text
 
             # Generate AI response
             response_text, error = chat_service.generate_response(
@@ -954,20 +1330,14 @@ class SendChatMessageModernView(APIView):
             )
 
             if error:
-                logger.error(f"Context question response error: {error}")
+                logger.error("Context question response error: %s", error)
                 response_text = "I'm sorry, I'm having trouble responding right now. Please try again."
 
             # Create question text for display
             if audio_file:
                 question_text = f"🎤 {transcribed_text or 'Audio recording'}"
             elif attachment_file:
-                file_icon = '📎'
-                if attachment_type == 'pdf':
-                    file_icon = '📄'
-                elif attachment_type == 'image':
-                    file_icon = '🖼️'
-                elif attachment_type == 'document':
-                    file_icon = '📝'
+                file_icon = FILE_ICON_BY_TYPE.get(attachment_type, DEFAULT_FILE_ICON)
                 question_text = f"{file_icon} {transcribed_text or f'Uploaded: {attachment_name}'}"
             else:
                 question_text = transcribed_text
@@ -981,7 +1351,7 @@ class SendChatMessageModernView(APIView):
                 context_summary=conversation.conversation_summary
             )
 
-            logger.info(f"💾 ContextQuestion saved - NO ChatMessage created! Returning context_question response")
+            logger.info("💾 ContextQuestion saved - NO ChatMessage created! Returning context_question response")
 
             # Return the context question data (NOT conversation messages)
             response_data = {
@@ -994,7 +1364,7 @@ class SendChatMessageModernView(APIView):
                 },
                 'conversation_id': str(conversation.id)
             }
-            logger.info(f"📤 Returning response with context_question (NO user_message or bot_message)")
+            logger.info("📤 Returning response with context_question (NO user_message or bot_message)")
             return Response(response_data, status=status.HTTP_201_CREATED)
 
         except ChatMessage.DoesNotExist:
@@ -1003,69 +1373,61 @@ class SendChatMessageModernView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
-            logger.error(f"Error handling context question upload: {str(e)}")
+            logger.error("Error handling context question upload: %s", e)
             return Response(
                 {'error': 'An error occurred while processing your upload'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
-    def save_audio_file(self, audio_file, conversation_id):
-        """Save audio file to media directory"""
-        import uuid
-        os.makedirs(settings.VOICE_FILES_DIR, exist_ok=True)
-        file_extension = audio_file.name.split('.')[-1]
-        filename = f"chat_{conversation_id}_{uuid.uuid4()}.{file_extension}"
+    def save_audio_file(self, audio_bytes, original_name, conversation_id):
+        """Save an already-read audio payload to the media directory"""
+        file_extension = os.path.splitext(original_name)[1].lower().lstrip('.')
+        filename = f"chat_{conversation_id}_{uuid.uuid4().hex}.{file_extension}"
         file_path = os.path.join(settings.VOICE_FILES_DIR, filename)
 
-        with open(file_path, 'wb+') as destination:
-            for chunk in audio_file.chunks():
-                destination.write(chunk)
+        with open_upload_destination(file_path, settings.VOICE_FILES_DIR) as destination:
+            destination.write(audio_bytes)
         return file_path
 
-    def save_attachment_file(self, attachment_file, conversation_id):
+    def save_attachment_file(self, attachment_file, conversation_id, declared_type=None):
         """Save attachment file (PDF, image, document) to media directory"""
-        import uuid
-
-        # Create attachments directory
-        attachments_dir = os.path.join(settings.MEDIA_ROOT, 'attachments')
-        os.makedirs(attachments_dir, exist_ok=True)
-
         # Get file extension and determine type
-        file_extension = attachment_file.name.split('.')[-1].lower()
-        filename = f"attachment_{conversation_id}_{uuid.uuid4()}.{file_extension}"
-        file_path = os.path.join(attachments_dir, filename)
-
-        # Determine attachment type
-        image_extensions = ['jpg', 'jpeg', 'png', 'gif', 'bmp', 'svg', 'webp']
-        document_extensions = ['doc', 'docx', 'txt', 'xls', 'xlsx', 'ppt', 'pptx']
-
-        if file_extension == 'pdf':
-            attachment_type = 'pdf'
-        elif file_extension in image_extensions:
-            attachment_type = 'image'
-        elif file_extension in document_extensions:
-            attachment_type = 'document'
+        file_extension = os.path.splitext(attachment_file.name)[1][1:].lower()
+        filename = f"attachment_{conversation_id}_{uuid.uuid4().hex}.{file_extension}"
+        file_path = os.path.join(ATTACHMENTS_DIR, filename)
+
+        # Clients that already know what they are uploading can declare
+        # the type; it is only trusted when it names a known category
+        if declared_type in ATTACHMENT_TYPES:
+            attachment_type = declared_type
         else:
-            attachment_type = 'other'
+            attachment_type = ATTACHMENT_TYPE_BY_EXTENSION.get(file_extension, 'other')
 
-        # Save file
-        with open(file_path, 'wb+') as destination:
-            for chunk in attachment_file.chunks():
-                destination.write(chunk)
+        # Save file. Uploads that Django spooled to disk
+        # (TemporaryUploadedFile) are renamed into place instead of being
+        # re-read and re-written through userspace
+        if hasattr(attachment_file, 'temporary_file_path'):
+            shutil.move(attachment_file.temporary_file_path(), file_path)
+        else:
+            with open_upload_destination(file_path, ATTACHMENTS_DIR) as destination:
+                shutil.copyfileobj(attachment_file, destination, length=UPLOAD_CHUNK_SIZE)
 
         return file_path, attachment_type
 
     def generate_title(self, text):
-        """Generate a short title from the first message"""
-        # Take first 50 characters or up to first sentence
-        title = text[:50]
-        if len(text) > 50:
-            # Try to break at word boundary
-            last_space = title.rfind(' ')
-            if last_space > 20:
-                title = title[:last_space]
-            title += "..."
-        return title
+        """
+        Generate a short title from the first message.
+
+        Pure string slicing - no LLM or I/O - so it is safe to call
+        inline on the first-message path.
+        """
+        if len(text) <= 50:
+            return text
+        # Break at a word boundary when one falls in a sensible range;
+        # the bounded rfind scans only that window and skips the
+        # intermediate text[:50] copy
+        last_space = text.rfind(' ', 20, 50)
+        return text[:last_space if last_space != -1 else 50] + "..."
 
 
 class GenerateSummaryView(APIView):
@@ -1082,36 +1444,84 @@ class GenerateSummaryView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-            # Get conversation and messages
-            conversation = ChatConversation.objects.get(id=conversation_id)
-            messages = conversation.messages.all().order_by('created_at')
+            # The summary is written back with a targeted UPDATE, so only
+            # the columns needed for the staleness check are fetched
+            conversation = ChatConversation.objects.only(
+                'id', 'conversation_summary', 'summary_generated_at'
+            ).get(id=conversation_id)
 
-            if not messages:
+            # One aggregate both detects the empty conversation and feeds
+            # the staleness checks below
+            latest_message_at = conversation.messages.aggregate(
+                latest=Max('created_at')
+            )['latest']
+
+            if latest_message_at is None:
                 return Response(
                     {'error': 'No messages to summarize'},
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
+            # Nothing said since the stored summary was generated - serve
+            # it and skip the LLM round-trip. Only 'all' summaries are
+            # stored on the conversation, so 'first' requests fall through
+            # to the cache below
+            if (summary_type == 'all'
+                    and conversation.conversation_summary
+                    and conversation.summary_generated_at
+                    and latest_message_at <= conversation.summary_generated_at):
+                return Response({
+                    'summary': conversation.conversation_summary,
+                    'conversation_id': str(conversation.id),
+                    'generated_at': conversation.summary_generated_at
+                }, status=status.HTTP_200_OK)
+
+            # Cross-process cache keyed on the latest message time: any new
+            # message changes the key, so stale summaries are unreachable
+            summary_cache_key = (
+                f"chat:summary:{conversation_id}:{summary_type}:"
+                f"{latest_message_at.timestamp()}"
+            )
+            cached = cache.get(summary_cache_key)
+            if cached is not None:
+                summary, generated_at = cached
+                return Response({
+                    'summary': summary,
+                    'conversation_id': str(conversation.id),
+                    'generated_at': generated_at
+                }, status=status.HTTP_200_OK)
+
+            messages = list(
+                conversation.messages.only(
+                    'message_type', 'transcribed_text', 'response_text'
+                ).order_by('created_at')
+            )
+
             # Generate summary
-            summary_service = SummaryService()
+            summary_service = get_summary_service()
             summary, error = summary_service.generate_conversation_summary(messages, summary_type)
 
             if error:
-                logger.error(f"Summary generation error: {error}")
+                logger.error("Summary generation error: %s", error)
                 return Response(
                     {'error': 'Failed to generate summary'},
                     status=status.HTTP_500_INTERNAL_SERVER_ERROR
                 )
 
-            # Update conversation with summary
-            conversation.conversation_summary = summary
-            conversation.summary_generated_at = timezone.now()
-            conversation.save()
+            # Write the summary with a targeted queryset UPDATE - no
+            # model save machinery, and nothing is read back since the
+            # timestamp is already in hand
+            generated_at = timezone.now()
+            ChatConversation.objects.filter(id=conversation.id).update(
+                conversation_summary=summary,
+                summary_generated_at=generated_at
+            )
+            cache.set(summary_cache_key, (summary, generated_at), HISTORY_CACHE_TTL)
 
             return Response({
                 'summary': summary,
                 'conversation_id': str(conversation.id),
-                'generated_at': conversation.summary_generated_at
+                'generated_at': generated_at
             }, status=status.HTTP_200_OK)
 
         except ChatConversation.DoesNotExist:
@@ -1120,7 +1530,7 @@ class GenerateSummaryView(APIView):
                 status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
-            logger.error(f"Error generating summary: {str(e)}")
+            logger.error("Error generating summary: %s", e)
             return Response(
                 {'error': 'An error occurred while generating summary'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -1142,10 +1552,34 @@ class AskContextQuestionView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
-            # Get conversation and messages
-            conversation = ChatConversation.objects.get(id=conversation_id)
-            message = ChatMessage.objects.get(id=message_id, conversation=conversation)
-            conversation_history = conversation.messages.all().order_by('created_at')
+            # One round-trip fetches the message joined to its
+            # conversation and validates the pairing at the same time;
+            # the history only feeds the prompt, so pull just the columns
+            # it is built from
+            message = ChatMessage.objects.select_related('conversation').get(
+                id=message_id, conversation_id=conversation_id
+            )
+            conversation = message.conversation
+            conversation_history = conversation.messages.only(
+                'message_type', 'transcribed_text', 'response_text'
+            ).order_by('created_at')
+
+            # An identical question about the same message, asked while
+            # the stored summary was the same, already has its answer
+            # persisted - return it instead of a fresh LLM call
+            repeat = ContextQuestion.objects.filter(
+                message=message,
+                question=question,
+                context_summary=conversation.conversation_summary
+            ).order_by('-created_at').values('id', 'answer').first()
+            if repeat is not None:
+                return Response({
+                    'question': question,
+                    'answer': repeat['answer'],
+                    'message_id': str(message_id),
+                    'conversation_id': str(conversation_id),
+                    'question_id': str(repeat['id'])
+                }, status=status.HTTP_200_OK)
 
             # Get previous context questions for this specific message to include in context
             previous_context_questions = ContextQuestion.objects.filter(
@@ -1153,13 +1587,13 @@ class AskContextQuestionView(APIView):
             ).order_by('created_at')
 
             # Generate answer using context
-            summary_service = SummaryService()
+            summary_service = get_summary_service()
             answer, error = summary_service.answer_context_question(
                 question, message, conversation_history, previous_context_questions
             )
 
             if error:
-                logger.error(f"Context question error: {error}")
+                logger.error("Context question error: %s", error)
                 return Response(
                     {'error': 'Failed to generate answer'},
                     status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -1182,18 +1616,16 @@ class AskContextQuestionView(APIView):
                 'question_id': str(context_question.id)
             }, status=status.HTTP_201_CREATED)
 
-        except ChatConversation.DoesNotExist:
-            return Response(
-                {'error': 'Conversation not found'},
-                status=status.HTTP_404_NOT_FOUND
-            )
         except ChatMessage.DoesNotExist:
+            # Covers both a missing message and a conversation mismatch -
+            # the combined fetch cannot tell them apart, and clients only
+            # need the 404
             return Response(
                 {'error': 'Message not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
         except Exception as e:
-            logger.error(f"Error answering context question: {str(e)}")
+            logger.error("Error answering context question: %s", e)
             return Response(
                 {'error': 'An error occurred while processing your question'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -1221,24 +1653,32 @@ class GetContextQuestionsView(APIView):
             if message_id:
                 questions = questions.filter(message_id=message_id)
 
-            questions = questions.order_by('-created_at')
-
-            # Serialize the data
-            questions_data = [{
-                'id': str(q.id),
-                'question': q.question,
-                'answer': q.answer,
-                'message_id': str(q.message.id),
-                'created_at': q.created_at
-            } for q in questions]
+            # Bounded page instead of every question the conversation has
+            # ever accumulated; limit/offset follow the voice request
+            # list's manual pagination style
+            limit = min(int(request.query_params.get('limit', 100)), 500)
+            offset = int(request.query_params.get('offset', 0))
+
+            total_count = questions.count()
+
+            # values() returns ready-made dicts - no model instance or
+            # Python-level field copying per row - and the orjson renderer
+            # stringifies the UUIDs and datetimes on output
+            questions_data = list(
+                questions.order_by('-created_at')
+                .values('id', 'question', 'answer', 'message_id', 'created_at')
+                [offset:offset + limit]
+            )
 
             return Response({
                 'questions': questions_data,
-                'count': len(questions_data)
+                'count': total_count,
+                'limit': limit,
+                'offset': offset
             }, status=status.HTTP_200_OK)
 
         except Exception as e:
-            logger.error(f"Error retrieving context questions: {str(e)}")
+            logger.error("Error retrieving context questions: %s", e)
             return Response(
                 {'error': 'An error occurred while retrieving questions'},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -0,0 +1,18 @@
+"""
+Celery application for background voice processing
+File: voicebot_project/celery.py
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'voicebot_project.settings')
+
+app = Celery('voicebot_project')
+
+# All Celery settings live in Django settings with the CELERY_ prefix
+app.config_from_object('django.conf:settings', namespace='CELERY')
+
+# Discover tasks.py modules in installed apps (voice_api.tasks)
+app.autodiscover_tasks()
@@ -59,13 +59,18 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'voicebot_project.wsgi.application'
 
-# Database - Use Railway PostgreSQL in production
+# Database - Use Railway PostgreSQL in production.
+# Health checks cost a SELECT 1 round-trip before every connection reuse;
+# they are off by default (Postgres on the same network rarely drops idle
+# connections inside conn_max_age) and can be re-enabled on flaky links
+DB_CONN_HEALTH_CHECKS = os.environ.get('DB_CONN_HEALTH_CHECKS', 'False') == 'True'
+
 if os.environ.get('DATABASE_URL'):
     DATABASES = {
         'default': dj_database_url.config(
             default=os.environ.get('DATABASE_URL'),
             conn_max_age=600,
-            conn_health_checks=True,
+            conn_health_checks=DB_CONN_HEALTH_CHECKS,
         )
     }
 else:
@@ -77,9 +82,21 @@ else:
             'PASSWORD': os.environ.get('DB_PASSWORD', ''),
             'HOST': os.environ.get('DB_HOST', 'localhost'),
             'PORT': os.environ.get('DB_PORT', '5432'),
+            'CONN_MAX_AGE': 600,
+            'CONN_HEALTH_CHECKS': DB_CONN_HEALTH_CHECKS,
         }
     }
 
+# Fail fast on an unreachable database instead of hanging for the libpq
+# default; transient connection errors surface as 500s and clients retry
+DATABASES['default'].setdefault('OPTIONS', {})['connect_timeout'] = 3
+
+# Set when the DATABASE_URL points at pgbouncer in transaction-pooling
+# mode: server-side cursors (used by .iterator()) break there
+DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = (
+    os.environ.get('DB_BEHIND_PGBOUNCER', 'False') == 'True'
+)
+
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
     {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
@@ -116,7 +133,7 @@ REST_FRAMEWORK = {
         'rest_framework.parsers.JSONParser',
     ],
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'voice_api.renderers.ORJSONRenderer',
     ],
 }
 
@@ -142,6 +159,47 @@ BREVO_SMTP_PASSWORD = os.environ.get('BREVO_SMTP_PASSWORD', '6x8bTRmzjSWJkgwh')
 # Base URL for email links - use environment variable or default to localhost for development
 BASE_URL = os.environ.get('BASE_URL', 'http://localhost:8000')
 
+# Cache - Redis in production (REDIS_URL), in-process memory otherwise
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ.get('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# TTL (seconds) for cached NLP results keyed by content hash
+NLP_CACHE_TTL = int(os.environ.get('NLP_CACHE_TTL', 86400))
+
+# Sessions - every authenticated request reads the session before any
+# business logic; keep them in Redis (sub-ms) instead of a DB SELECT
+if os.environ.get('REDIS_URL'):
+    SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
+    SESSION_CACHE_ALIAS = 'default'
+
+# Celery - background voice processing pipeline
+CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', 'redis://localhost:6379/0')
+CELERY_RESULT_BACKEND = os.environ.get('CELERY_RESULT_BACKEND', CELERY_BROKER_URL)
+
+# Run tasks inline when no broker is deployed (local development without Redis)
+CELERY_TASK_ALWAYS_EAGER = os.environ.get(
+    'CELERY_TASK_ALWAYS_EAGER',
+    'False' if 'CELERY_BROKER_URL' in os.environ else 'True'
+) == 'True'
+
+# Route transcription (I/O bound ASR) and LLM calls (intent/entities) to
+# separate queues so each worker pool can scale independently
+CELERY_TASK_ROUTES = {
+    'voice_api.tasks.transcribe_voice_request': {'queue': 'asr'},
+    'voice_api.tasks.analyze_voice_request': {'queue': 'nlp'},
+}
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
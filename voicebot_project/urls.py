@@ -4,21 +4,37 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.views.generic import TemplateView
 from django.http import JsonResponse, HttpResponse
+from django.views.decorators.http import condition
 from django.views.static import serve
+from datetime import datetime, timezone as dt_timezone
+import hashlib
 import os
 
 # Simple view to handle Chrome DevTools requests
 def chrome_devtools_handler(request):
     return JsonResponse({}, status=200)
 
+# The service worker file only changes on deploy (new process), so its
+# body, ETag, and mtime are read once at import; browsers re-fetch sw.js
+# on every page load and the conditional check turns those into 304s,
+# while full responses are served straight from memory with no file I/O
+_SW_PATH = os.path.join(settings.BASE_DIR, 'static', 'sw.js')
+with open(_SW_PATH, 'rb') as _f:
+    _SW_BODY = _f.read()
+_SW_ETAG = f'"{hashlib.sha1(_SW_BODY).hexdigest()}"'
+_SW_LAST_MODIFIED = datetime.fromtimestamp(
+    os.path.getmtime(_SW_PATH), tz=dt_timezone.utc
+)
+
 # Service Worker view with proper headers
+@condition(etag_func=lambda request: _SW_ETAG,
+           last_modified_func=lambda request: _SW_LAST_MODIFIED)
 def service_worker_view(request):
     """Serve service worker with Service-Worker-Allowed header"""
-    sw_path = os.path.join(settings.BASE_DIR, 'static', 'sw.js')
-    with open(sw_path, 'r') as f:
-        content = f.read()
-    response = HttpResponse(content, content_type='application/javascript')
+    response = HttpResponse(_SW_BODY, content_type='application/javascript')
     response['Service-Worker-Allowed'] = '/'
+    # Let browsers revalidate instead of refusing to cache outright; the
+    # ETag/Last-Modified pair answers the revalidation with a bodyless 304
     response['Cache-Control'] = 'no-cache'
     return response
 